@@ -23,6 +23,7 @@ VSYNC_ENABLED = True              # Enable vertical sync to prevent screen teari
 # === Texture Softening Settings ===
 MIPMAPPING_ENABLED = True         # Enable mipmapping for better distant textures
 ANISOTROPIC_FILTERING = 8         # Anisotropic filtering level: 0, 2, 4, 8, 16 (0 = disabled)
+ANISOTROPIC_FILTERING_CAP = 8     # Upper limit for anisotropic filtering (0 = no cap)
 TEXTURE_SOFTENING = True          # Enable additional texture softening effects
 TEXTURE_BLUR_AMOUNT = 0.5         # Texture blur/softening amount (0.0 = none, 1.0 = maximum)
 TEXTURE_QUALITY = 'high'          # Texture quality: 'low', 'medium', 'high', 'ultra'
@@ -90,6 +91,7 @@ SLIDE_FRICTION = 6                # How quickly slide velocity decreases
 SLIDE_START_VELOCITY = 40         # Initial velocity when starting slide
 SLIDE_COOLDOWN = 2.0              # Seconds before can slide again
 SLIDE_CAMERA_Y = 1.0              # Camera height when sliding (crouched)
+SLIDE_SLOPE_CHECK_INTERVAL = 4    # Re-sample the ground slope every N grounded sliding frames
 GRAVITY_FORCE = 10.0              # Additional gravity force on slopes during slide
 
 # === Dash System ===
@@ -103,6 +105,7 @@ WALL_RUN_MAX_TIME = 8.0           # Maximum time you can wall run (seconds)
 WALL_RUN_JUMP_FORCE = 20          # Force applied when jumping off wall
 WALL_RUN_CAMERA_TILT = 15         # Camera tilt angle during wall run (degrees)
 WALL_END_MOMENTUM_KICK = 20       # Momentum multiplier when wall ends naturally (1.0 = no boost)
+WALL_RUN_DETECT_INTERVAL = 3      # Look for a wall to run on every N airborne frames
 
 # ===============================================
 # === WEAPON SYSTEMS ===========================
@@ -113,10 +116,11 @@ GUN_MODEL_PATH = './assets/gun3.obj'           # Path to gun 3D model
 GUN_TEXTURE_PATH = './assets/textures/gun3_texture.png'  # Gun texture
 GUN_SCALE = 0.1                   # Scale of gun model
 GUN_OFFSET = Vec3(0.3, -0.2, 1.5) # Gun position relative to camera
+GUN_SWAY_ENABLED = True           # Gun pitch lags behind the camera (False = locked to view)
 
 # === Shooting Mechanics ===
 SHOOTING_ENABLED = True           # Enable shooting
-BULLET_RANGE = 9999               # Maximum bullet range
+BULLET_RANGE = 200                # Maximum bullet range (map is ~100 units across)
 
 # === Gun Physics ===
 GUN_GRAVITY = 12                  # Gravity applied to dropped guns
@@ -145,12 +149,6 @@ GRAPPLE_COOLDOWN = 0.01            # Cooldown between grapple uses (seconds)
 GRAPPLE_GRAVITY_REDUCTION = 0.5   # Gravity multiplier when grappling (0.0 = no gravity, 1.0 = full gravity)
 GRAPPLE_RETRACTION_SPEED = 2.0    # Speed at which cable automatically retracts (units per second)
 
-# ===============================================
-# === COLLISION & PHYSICS =======================
-# ===============================================
-
-HEAD_HEIGHT_OFFSET = Vec3(0, 1.8, 0)    # Offset for ceiling collision checks
-
 # ===============================================
 # === GAME MODES & SCORING =====================
 # ===============================================
@@ -199,4 +197,5 @@ COLLISION_PUSH_DISTANCE = 0.5           # Distance to push player when stuck in
 # === DEBUG & DEVELOPMENT ======================
 # ===============================================
 
-DEBUG_MODE = False                # Enable debug mode
\ No newline at end of file
+DEBUG_MODE = False                # Enable debug mode
+DEBUG_WALL_RUN = False            # Print wall running debug messages
\ No newline at end of file
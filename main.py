@@ -43,12 +43,14 @@ except ImportError as e:
     sys.exit(1)
 
 try:
+    from core.graphics_utils import configure_texture_defaults
     from core.player import PlayerController
     from core.weapons import WeaponController
     from systems.targets import TargetManager
     from ui.game_state import GameState
     from ui.menu import MenuSystem
     from systems.map_environment import MapEnvironment
+    from systems.assets import start_preload, finish_preload
     from systems.wall_running import *
     from systems.physics import *
     from core.input_handler import input  # Import the input function so Ursina can use it
@@ -64,6 +66,10 @@ except ImportError as e:
 # === GAME INITIALIZATION ======================
 # ===============================================
 
+# Start reading asset files on a worker thread now, so the reads overlap
+# window and graphics setup below (the worker only touches the disk)
+start_preload()
+
 # Initialize Ursina engine with antialiasing
 app = Ursina()
 
@@ -154,19 +160,8 @@ try:
         render.setShaderAuto()
         print("✅ Linear texture filtering enabled")
     
-    # Configure mipmapping globally
-    if MIPMAPPING_ENABLED:
-        # Enable automatic mipmap generation for all textures
-        from panda3d.core import ConfigVariableBool
-        ConfigVariableBool("texture-minfilter", "linear_mipmap_linear").setValue("linear_mipmap_linear")
-        ConfigVariableBool("texture-magfilter", "linear").setValue("linear")
-        print("✅ Mipmapping enabled")
-    
-    # Configure anisotropic filtering
-    if ANISOTROPIC_FILTERING > 0:
-        from panda3d.core import ConfigVariableInt
-        ConfigVariableInt("texture-anisotropic-degree", ANISOTROPIC_FILTERING).setValue(ANISOTROPIC_FILTERING)
-        print(f"✅ Anisotropic filtering enabled: {ANISOTROPIC_FILTERING}x")
+    # Configure mipmapping and anisotropic filtering globally
+    configure_texture_defaults()
     
     # Apply texture quality settings
     apply_texture_quality_settings()
@@ -174,6 +169,10 @@ try:
 except Exception as e:
     print(f"⚠️ Advanced texture filtering not available: {e}")
 
+# Load the assets the worker has read ahead, so every system below is built
+# from already-cached models and textures
+finish_preload()
+
 # Initialize all game systems in correct order
 map_environment = MapEnvironment()
 player_controller = PlayerController()
@@ -217,15 +216,14 @@ def update():
     Main game update loop - called every frame by Ursina engine.
     Coordinates all game systems including physics, input, and rendering.
     """
-    # Early exit if game is not active
-    if not player_controller.player.enabled and not game_state.is_timed_mode:
-        return
-    
-    # Safety check for critical objects
-    if not player_controller.player or not hasattr(player_controller.player, 'position'):
+    # Everything below is gameplay: skip it whenever the player is inactive
+    # (menu and results screen; timed mode always enables the player)
+    player = player_controller.player
+    if not player or not player.enabled:
         return
 
     # === CORE SYSTEM UPDATES ===
+    player_controller.read_move_input()
     player_controller.update_velocity_measurement()
     player_controller.update_timers()
     weapon_controller.update_gun_position()
@@ -12,6 +12,37 @@ from config import *
 # === GRAPHICS UTILITIES =======================
 # ===============================================
 
+def configure_texture_defaults():
+    """
+    Set global texture filtering defaults once at startup.
+    
+    Must run before any entity loads its textures so every texture is
+    imported with these filter settings.
+    """
+    try:
+        from panda3d.core import ConfigVariableString, ConfigVariableInt
+        
+        # TEXTURE_FILTERING picks the filter; mipmaps only refine minification
+        if TEXTURE_FILTERING == 'nearest':
+            minfilter = magfilter = 'nearest'
+        else:
+            magfilter = 'linear'
+            minfilter = 'linear_mipmap_linear' if MIPMAPPING_ENABLED else 'linear'
+        ConfigVariableString("texture-minfilter").setValue(minfilter)
+        ConfigVariableString("texture-magfilter").setValue(magfilter)
+        
+        anisotropy = ANISOTROPIC_FILTERING
+        if ANISOTROPIC_FILTERING_CAP > 0:
+            anisotropy = min(anisotropy, ANISOTROPIC_FILTERING_CAP)
+        ConfigVariableInt("texture-anisotropic-degree").setValue(max(anisotropy, 1))
+        
+        print(f"✅ Texture filtering defaults set: {minfilter}/{magfilter}, {anisotropy}x anisotropic")
+        return True
+        
+    except Exception as e:
+        print(f"⚠️ Could not set texture filtering defaults: {e}")
+        return False
+
 def set_antialiasing(samples=4, enabled=True):
     """
     Dynamically set antialiasing level.
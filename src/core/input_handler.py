@@ -74,8 +74,7 @@ def input(key):
     if key == 'left mouse down':
         if hasattr(weapon_controller, 'gun_equipped') and weapon_controller.gun_equipped:
             try:
-                if hasattr(target_manager, 'target_spheres'):
-                    weapon_controller.shoot(target_manager.target_spheres, game_state)
+                weapon_controller.shoot(target_manager, game_state)
             except AttributeError as e:
                 print(f"Error during shooting - missing attribute: {e}")
             except Exception as e:
@@ -14,12 +14,16 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'core'))
 
 from config import *
 from utils import *
+from systems.physics_numeric import step_slide_slope, world_move_direction
 import math
 
 # ===============================================
 # === PLAYER SYSTEM ============================
 # ===============================================
 
+# Camera height gap below which the slide/stand camera ease stops writing the transform
+CAMERA_SETTLE_EPSILON = 0.001
+
 from typing import Optional
 
 class PlayerController:
@@ -52,17 +56,27 @@ class PlayerController:
             scale=(PLAYER_WIDTH, PLAYER_HEIGHT, PLAYER_WIDTH),
             position=(0, PLAYER_HEIGHT/2, 0),
             collider=None,
-            visible=DEBUG_MODE  # Only visible in debug mode
+            visible=DEBUG_MODE,  # Only visible in debug mode
+            add_to_scene_entities=False  # No update/collider, so skip scene.entities
         )
         
+        # Entities every collision raycast skips (built once, reused each frame)
+        self._collision_ignore = (self.player, self.player_model)
+        
         # Movement state
         self.movement_velocity = Vec3(0, 0, 0)
         self.measured_player_velocity = Vec3(0, 0, 0)
         
+        # WASD axes for this frame, sampled once by read_move_input()
+        self.input_x = 0  # right-left
+        self.input_z = 0  # forward-back
+        
         # Movement state flags
         self.is_sliding = False
         self.slide_velocity = 0
         self.slide_direction = Vec3(0, 0, 0)
+        self._slide_slope_normal = None  # Last ground normal under the slide (None = no ground hit)
+        self._slide_slope_counter = 0    # Grounded sliding frames since the last slope raycast
         self.is_airborne = False
         self.is_sprinting = False
         self.slide_timer = 0.0
@@ -74,6 +88,12 @@ class PlayerController:
         self.wall_normal = Vec3(0, 0, 0)
         self.wall_run_side = 0  # -1 for left wall, 1 for right wall, 0 for no wall
         
+        # Last wall plane seen by the wall-still-there check (None = no cache)
+        self._wr_cached_plane_point = None
+        self._wr_cached_plane_normal = None
+        self._wr_last_check_pos = None
+        self._wr_detect_counter = 0  # Airborne frames since the last wall detection
+        
         # Jump speed system
         self.jump_speed_active = False
         self.jump_speed_timer = 0.0
@@ -92,8 +112,10 @@ class PlayerController:
         Uses frame time delta to compute velocity from position changes.
         Includes safety checks for zero delta time and initialization.
         """
+        dt = time.dt
+        
         # Early validation
-        if not hasattr(self.player, 'position') or time.dt <= 0:
+        if not hasattr(self.player, 'position') or dt <= 0:
             if not hasattr(self, 'measured_player_velocity'):
                 self.measured_player_velocity = Vec3(0, 0, 0)
             return
@@ -101,7 +123,7 @@ class PlayerController:
         try:
             self.measured_player_velocity = (
                 self.player.position - self.measured_player_prev_pos
-            ) / time.dt
+            ) / dt
             self.measured_player_prev_pos = self.player.position
         except (AttributeError, ZeroDivisionError, TypeError) as e:
             # Log error but don't expose details to user
@@ -112,10 +134,17 @@ class PlayerController:
             # Catch any other unexpected errors
             self.measured_player_velocity = Vec3(0, 0, 0)
     
+    def read_move_input(self):
+        """Sample the WASD movement axes once for this frame."""
+        keys = held_keys
+        self.input_x = keys['d'] - keys['a']  # right-left
+        self.input_z = keys['w'] - keys['s']  # forward-back
+    
     def update_timers(self):
         """Update all cooldown timers."""
-        self.slide_timer = max(self.slide_timer - time.dt, 0)
-        self.dash_timer = max(self.dash_timer - time.dt, 0)
+        dt = time.dt
+        self.slide_timer = max(self.slide_timer - dt, 0)
+        self.dash_timer = max(self.dash_timer - dt, 0)
         self.update_jump_speed_timer()
         self.update_jump_feel_timers()
     
@@ -135,21 +164,33 @@ class PlayerController:
             self.slide_velocity = SLIDE_START_VELOCITY
             self.slide_direction = self.player.forward.normalized()
             self.slide_timer = SLIDE_COOLDOWN
+            self._slide_slope_counter = 0  # Sample the slope on the first slide frame
             # Reset horizontal movement velocity
             self.movement_velocity.x = 0
             self.movement_velocity.z = 0
     
     def handle_sliding_physics(self):
         """Handle sliding physics and camera."""
+        dt = time.dt
         if self.is_sliding:
-            hit_info = raycast(self.player.position, Vec3(0, -1, 0), distance=2, ignore=[self.player])
-            if hit_info.hit:
-                slope_normal = hit_info.normal
-                downhill = Vec3(-slope_normal.x, 0, -slope_normal.z).normalized()
-                self.slide_direction = lerp(self.slide_direction, downhill, time.dt * 2)
-                self.slide_velocity += GRAVITY_FORCE * (1 - hit_info.normal.y) * time.dt
+            # Grounded slides reuse the last slope for SLIDE_SLOPE_CHECK_INTERVAL frames;
+            # airborne slides sample it every frame
+            if not self.player.grounded or self._slide_slope_counter % SLIDE_SLOPE_CHECK_INTERVAL == 0:
+                hit_info = raycast(self.player.position, Vec3(0, -1, 0), distance=2, ignore=[self.player])
+                self._slide_slope_normal = hit_info.normal if hit_info.hit else None
+            self._slide_slope_counter += 1
+            
+            slope_normal = self._slide_slope_normal
+            if slope_normal is not None:
+                # Downhill steering and slope acceleration run in the numeric kernel
+                direction = self.slide_direction
+                direction.x, direction.y, direction.z, self.slide_velocity = step_slide_slope(
+                    direction.x, direction.y, direction.z, self.slide_velocity,
+                    slope_normal.x, slope_normal.y, slope_normal.z,
+                    dt, GRAVITY_FORCE
+                )
 
-            slide_step = self.slide_direction * self.slide_velocity * time.dt
+            slide_step = self.slide_direction * self.slide_velocity * dt
             hit = raycast(self.player.position, self.slide_direction, distance=slide_step.length() + 0.5, ignore=[self.player])
             if not hit.hit:
                 self.player.position += slide_step
@@ -157,14 +198,18 @@ class PlayerController:
                 self.is_sliding = False
                 self.slide_velocity = 0
 
-            self.player.camera_pivot.y = lerp(self.player.camera_pivot.y, SLIDE_CAMERA_Y, time.dt * 8)
-            self.slide_velocity = max(self.slide_velocity - SLIDE_FRICTION * time.dt, 0)
+            camera_pivot = self.player.camera_pivot
+            if abs(camera_pivot.y - SLIDE_CAMERA_Y) > CAMERA_SETTLE_EPSILON:
+                camera_pivot.y = lerp(camera_pivot.y, SLIDE_CAMERA_Y, dt * 8)
+            self.slide_velocity = max(self.slide_velocity - SLIDE_FRICTION * dt, 0)
 
             if held_keys['space']:
                 self.is_sliding = False
                 self.slide_velocity = 0
         else:
-            self.player.camera_pivot.y = lerp(self.player.camera_pivot.y, NORMAL_CAMERA_Y, time.dt * 6)
+            camera_pivot = self.player.camera_pivot
+            if abs(camera_pivot.y - NORMAL_CAMERA_Y) > CAMERA_SETTLE_EPSILON:
+                camera_pivot.y = lerp(camera_pivot.y, NORMAL_CAMERA_Y, dt * 6)
     
     def handle_dash_input(self):
         """Handle dash input - applies force in look direction."""
@@ -175,8 +220,8 @@ class PlayerController:
             
             # Apply horizontal force (X and Z)
             dash_direction = camera.forward.normalized()
-            horizontal_component = Vec3(dash_direction.x, 0, dash_direction.z).normalized()
-            if horizontal_component.length() > 0:
+            if dash_direction.x or dash_direction.z:
+                horizontal_component = Vec3(dash_direction.x, 0, dash_direction.z).normalized()
                 self.movement_velocity.x += horizontal_component.x * horizontal_force
                 self.movement_velocity.z += horizontal_component.z * horizontal_force
             
@@ -214,21 +259,17 @@ class PlayerController:
         # Determine jump direction
         if JUMP_SPEED_DIRECTIONAL:
             # Use current movement input direction
-            input_dir = Vec3(
-                held_keys['d'] - held_keys['a'],  # right-left
-                0,
-                held_keys['w'] - held_keys['s']   # forward-back
-            )
-            if input_dir.length() > 0:
-                input_dir = input_dir.normalized()
-                self.jump_direction = (camera.forward * input_dir.z + camera.right * input_dir.x)
-                self.jump_direction.y = 0
-                if self.jump_direction.length() > 0:
-                    self.jump_direction = self.jump_direction.normalized()
+            if self.input_x or self.input_z:
+                # Same WASD -> horizontal world direction transform as ground movement
+                cam_forward, cam_right = camera.forward, camera.right
+                dir_x, dir_z = world_move_direction(
+                    self.input_x, self.input_z,
+                    cam_forward.x, cam_forward.z, cam_right.x, cam_right.z
+                )
+                if dir_x or dir_z:
+                    self.jump_direction = Vec3(dir_x, 0, dir_z)
                 else:
-                    self.jump_direction = camera.forward
-                    self.jump_direction.y = 0
-                    self.jump_direction = self.jump_direction.normalized()
+                    self.jump_direction = Vec3(cam_forward.x, 0, cam_forward.z).normalized()
             else:
                 # No input, use camera forward direction
                 self.jump_direction = camera.forward
@@ -236,9 +277,9 @@ class PlayerController:
                 self.jump_direction = self.jump_direction.normalized()
         else:
             # Use current movement velocity direction
-            horiz_vel = Vec3(self.movement_velocity.x, 0, self.movement_velocity.z)
-            if horiz_vel.length() > 0:
-                self.jump_direction = horiz_vel.normalized()
+            velocity = self.movement_velocity
+            if velocity.x or velocity.z:
+                self.jump_direction = Vec3(velocity.x, 0, velocity.z).normalized()
             else:
                 self.jump_direction = camera.forward
                 self.jump_direction.y = 0
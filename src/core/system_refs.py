@@ -0,0 +1,101 @@
+"""
+System References
+=================
+
+Cached lookups of the global game systems that main.py publishes on their
+modules, and a pre-bound table for showing/hiding them.
+"""
+
+import importlib
+from functools import partial
+
+# ===============================================
+# === SYSTEM REFERENCES =========================
+# ===============================================
+
+# Global name -> module it is published on (main.py assigns these at startup)
+SYSTEM_MODULES = {
+    'player_controller': 'src.core.player',
+    'weapon_controller': 'src.core.weapons',
+    'target_manager': 'src.systems.targets',
+    'game_state': 'src.ui.game_state',
+    'menu_system': 'src.ui.menu',
+    'map_environment': 'src.systems.map_environment',
+}
+
+# Resolved systems; names are only cached once main.py has set them
+_refs = {}
+
+def get_system(name):
+    """
+    Return a global game system, resolving it from its module on first use.
+
+    Args:
+        name (str): Global name, e.g. 'player_controller'
+
+    Returns:
+        The system object, or None if it has not been created yet
+    """
+    ref = _refs.get(name)
+    if ref is not None:
+        return ref
+
+    try:
+        module = importlib.import_module(SYSTEM_MODULES[name])
+    except (ImportError, KeyError):
+        return None
+
+    ref = getattr(module, name, None)
+    if ref is not None:
+        _refs[name] = ref
+    return ref
+
+# ===============================================
+# === GAME ELEMENT TOGGLING =====================
+# ===============================================
+
+# Systems shown while playing and hidden in menus
+GAME_ELEMENTS = ('map_environment', 'player_controller', 'weapon_controller', 'target_manager')
+PLAYER_ELEMENTS = ('player_controller', 'weapon_controller')
+
+# Pre-bound show/hide callables per (enabled, names), built once all systems exist
+_element_actions = {}
+
+def _make_element_action(name, system, enabled):
+    """Bind the show/hide call for one game system."""
+    if name == 'map_environment':
+        return system.show_game if enabled else system.hide_game
+    if name == 'player_controller':
+        return partial(setattr, system.player, 'enabled', enabled)
+    if name == 'target_manager':
+        # Targets share one parent entity, so this hides or shows all of them at once
+        return partial(setattr, system.targets_parent, 'enabled', enabled)
+
+    def set_weapon_enabled():
+        # gun_model is replaced on respawn, so look it up at call time
+        system.gun_model.enabled = enabled
+        system.gun_equipped = enabled
+    return set_weapon_enabled
+
+def set_game_elements_enabled(enabled, names=GAME_ELEMENTS):
+    """
+    Show or hide game systems through a cached table of bound callables.
+
+    Args:
+        enabled (bool): True to show, False to hide
+        names (tuple): Which systems to toggle (see GAME_ELEMENTS)
+    """
+    key = (enabled, names)
+    actions = _element_actions.get(key)
+    if actions is None:
+        actions = []
+        for name in names:
+            system = get_system(name)
+            if system is not None:
+                actions.append(_make_element_action(name, system, enabled))
+        # Only cache once every system exists, so early calls don't pin a partial table
+        if len(actions) == len(names):
+            _element_actions[key] = actions
+
+    for action in actions:
+        action()
@@ -6,6 +6,9 @@ Common utility functions used throughout the game.
 """
 
 from ursina import *
+from ursina.hit_info import HitInfo
+from ursina.scene import instance as scene
+from panda3d.core import CollisionTraverser, CollisionHandlerQueue, CollisionNode, CollisionSegment
 from config import *
 import math
 
@@ -44,6 +47,102 @@ def check_collision(origin, direction, distance, ignore_list=None):
         # Return safe default if raycast fails (asset loading issues, etc.)
         return None
 
+class RayBatch:
+    """
+    Casts a fixed set of rays with a single CollisionTraverser pass.
+    
+    Each ray is a CollisionSegment on its own node, so one traverse() call
+    tests all of them against the scene instead of one traversal per ray.
+    """
+    
+    def __init__(self, ray_count):
+        self.traverser = CollisionTraverser('ray_batch')
+        self.queue = CollisionHandlerQueue()
+        self.root = Entity(add_to_scene_entities=False)
+        self.segments = []
+        
+        for index in range(ray_count):
+            node = CollisionNode(f'ray_batch_{index}')
+            node.set_into_collide_mask(0)
+            segment = CollisionSegment()
+            node.addSolid(segment)
+            node_path = self.root.attach_new_node(node)
+            node_path.set_python_tag('ray_index', index)
+            self.traverser.addCollider(node_path, self.queue)
+            self.segments.append(segment)
+    
+    def cast(self, origins, direction, distance, ignore=()):
+        """
+        Cast every ray in one traversal.
+        
+        Args:
+            origins (list): One Vec3 origin per ray
+            direction (Vec3): Normalized direction shared by all rays
+            distance (float): Ray length
+            ignore (tuple): Entities to ignore
+        
+        Returns:
+            list: Nearest HitInfo per ray, or None where the ray hit nothing
+        """
+        step = direction * distance
+        for segment, origin in zip(self.segments, origins):
+            segment.setPointA(origin)
+            segment.setPointB(origin + step)
+        
+        return self._traverse(origins, ignore)
+    
+    def cast_each(self, origins, directions, distances, ignore=()):
+        """
+        Cast rays with their own directions and lengths in one traversal.
+        
+        Args:
+            origins (list): One Vec3 origin per ray
+            directions (list): One normalized Vec3 direction per ray
+            distances (list): One ray length per ray
+            ignore (tuple): Entities to ignore
+        
+        Returns:
+            list: Nearest HitInfo per ray, or None where the ray hit nothing
+        """
+        for segment, origin, direction, distance in zip(self.segments, origins, directions, distances):
+            segment.setPointA(origin)
+            segment.setPointB(origin + direction * distance)
+        
+        return self._traverse(origins, ignore)
+    
+    def _traverse(self, origins, ignore):
+        """Run the traversal and collect the nearest valid hit per ray."""
+        self.queue.clearEntries()
+        self.traverser.traverse(scene)
+        
+        hits = [None] * len(self.segments)
+        if self.queue.get_num_entries() == 0:
+            return hits
+        
+        self.queue.sort_entries()
+        for entry in self.queue.getEntries():
+            index = entry.get_from_node_path().get_python_tag('ray_index')
+            if hits[index] is not None:
+                continue
+            
+            into_entity_np = entry.get_into_node_path().parent
+            entity = into_entity_np.getPythonTag('Entity')
+            if entity is None or entity in ignore or entity not in scene.collidables:
+                continue
+            
+            world_point = Vec3(*entry.get_surface_point(render))
+            hits[index] = HitInfo(
+                hit=True,
+                entity=entity,
+                point=Vec3(*entry.get_surface_point(into_entity_np)),
+                world_point=world_point,
+                distance=(world_point - origins[index]).length(),
+                normal=Vec3(*entry.get_surface_normal(into_entity_np).normalized()),
+                world_normal=Vec3(*entry.get_surface_normal(render).normalized())
+            )
+        
+        return hits
+
 def apply_slide_movement(movement, collision_normal):
     """
     Calculate sliding movement along a surface when hitting a wall.
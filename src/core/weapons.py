@@ -14,17 +14,29 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'core'))
 
 from config import *
 from utils import *
+from systems.assets import get_model, get_texture
 import random
 
 # ===============================================
 # === WEAPONS SYSTEM ===========================
 # ===============================================
 
+# Gun pitch lag (degrees) below which the gun is snapped level with the camera
+GUN_PITCH_SETTLE_EPSILON = 0.001
+
+# Points for one target hit in timed mode (config is fixed at startup)
+POINTS_PER_HIT = POINTS_PER_TARGET if SCORE_MULTIPLIER == 1.0 else int(POINTS_PER_TARGET * SCORE_MULTIPLIER)
+
+# Share of gravity left while grappling, as an acceleration (config is fixed at startup)
+GRAPPLE_GRAVITY_COMPENSATION = (1.0 - GRAPPLE_GRAVITY_REDUCTION) * 9.8 * PLAYER_GRAVITY
+
 class WeaponController:
     def __init__(self, player_controller):
         self.player_controller = player_controller
         self.gun_drop_timer = 0
+        self.gun_respawn_timer = None  # Seconds until a dropped gun is re-equipped (None = not pending)
         self.gun_equipped = True
+        self._dropped_gun = None  # Reused by every drop_and_respawn_gun call
         
         # Recoil system
         self.recoil_timer = 0
@@ -46,8 +58,13 @@ class WeaponController:
             current_dir = Path.cwd()
             
             # Validate sound file path
-            if str(sound_path).startswith(str(current_dir)) and sound_path.exists():
+            if SFX_VOLUME <= 0:
+                # Muted: never load or play the sound
+                self.gunshot_sound = None
+            elif str(sound_path).startswith(str(current_dir)) and sound_path.exists():
                 self.gunshot_sound = Audio(GUNSHOT_SOUND, loop=False, autoplay=False)
+                # Volume settings are fixed at startup, so set it once rather than per shot
+                self.gunshot_sound.volume = min(1.0, max(0.0, SFX_VOLUME * MASTER_VOLUME))
             else:
                 print(f"Warning: Invalid or missing sound file: {GUNSHOT_SOUND}")
                 self.gunshot_sound = None
@@ -55,70 +72,88 @@ class WeaponController:
             print(f"Warning: Could not load gunshot sound: {e}")
             self.gunshot_sound = None
         
-        # Create gun model
+        # Create gun model, parented to the camera so the scene graph keeps it at GUN_OFFSET
         self.gun_model = Entity(
-            model=GUN_MODEL_PATH,
-            position=(0, 1.3, 2),
+            model=get_model(GUN_MODEL_PATH),
+            position=GUN_OFFSET,
             scale=GUN_SCALE,
             collider=None,
             shader=lit_with_shadows_shader,
             double_sided=True,
-            parent=player_controller.player
+            parent=camera
         )
-        self.gun_model.texture = GUN_TEXTURE_PATH
+        self.gun_model.texture = get_texture(GUN_TEXTURE_PATH)
+        self._gun_pitch = 0.0  # Smoothed world pitch the gun lags behind the camera with
+        # The player's pitch node never changes, so resolve it once for update_gun_position
+        self._camera_pivot = getattr(player_controller.player, 'camera_pivot', None)
         
-        # Gun barrel reference point
+        # Gun barrel reference point (no update/collider, so kept out of scene.entities)
         self.barrel = Entity(
             parent=self.gun_model,
             position=(0, 0.1, 2.2),
             scale=0.02,
-            visible=False
+            visible=False,
+            add_to_scene_entities=False
         )
     
     def update_gun_position(self):
-        """Update gun model position and rotation to follow camera movement."""
-        if self.gun_model and hasattr(self.gun_model, 'world_position'):
-            try:
-                # Position gun relative to camera
-                self.gun_model.world_position = (
-                    camera.world_position +
-                    camera.forward * GUN_OFFSET.z +
-                    camera.right * GUN_OFFSET.x +
-                    camera.up * GUN_OFFSET.y
-                )
-                # Smoothly rotate gun to match camera pitch
-                target_rot = Vec3(self.player_controller.player.camera_pivot.rotation_x, 0, 0)
-                self.gun_model.rotation = lerp(self.gun_model.rotation, target_rot, time.dt * 10)
-                self.gun_model.visible = True
-            except AttributeError:
-                pass
+        """Smooth the gun's pitch; its position follows the camera through the scene graph."""
+        # Parented to the camera, the gun already matches its pitch exactly; the lag is
+        # visual sway only, so skip it when disabled or while the gun is dropped/hidden
+        if not GUN_SWAY_ENABLED or not self.gun_equipped:
+            return
+        gun_model = self.gun_model
+        camera_pivot = self._camera_pivot
+        if gun_model and camera_pivot is not None:
+            # Gun pitch eases toward the camera pitch; the local rotation is the lag
+            camera_pitch = camera_pivot.rotation_x
+            gun_pitch = self._gun_pitch
+            if abs(gun_pitch - camera_pitch) <= GUN_PITCH_SETTLE_EPSILON:
+                # Settled: snap once, then leave the transform untouched
+                if gun_pitch != camera_pitch:
+                    self._gun_pitch = camera_pitch
+                    gun_model.rotation_x = 0
+                return
+            gun_pitch = lerp(gun_pitch, camera_pitch, time.dt * 10)
+            self._gun_pitch = gun_pitch
+            gun_model.rotation_x = gun_pitch - camera_pitch
     
     def update_timers(self):
         """Update weapon-related timers."""
-        self.gun_drop_timer = max(self.gun_drop_timer - time.dt, 0)
-        self.grapple_timer = max(self.grapple_timer - time.dt, 0)
+        dt = time.dt
+        # Cooldowns sit at 0 almost every frame, so only count down the armed ones
+        if self.gun_drop_timer > 0:
+            self.gun_drop_timer = max(self.gun_drop_timer - dt, 0)
+        if self.grapple_timer > 0:
+            self.grapple_timer = max(self.grapple_timer - dt, 0)
+        if self.gun_respawn_timer is not None:
+            self.gun_respawn_timer -= dt
+            if self.gun_respawn_timer <= 0:
+                self.respawn_gun()
+        self.update_dropped_gun(dt)
         self.update_recoil()
         self.update_grapple()
     
     def update_recoil(self):
         """Update recoil recovery over time."""
         if self.recoil_timer > 0:
-            self.recoil_timer -= time.dt
+            dt = time.dt
+            self.recoil_timer -= dt
             
             # Calculate recovery factor (0 to 1, where 1 is full recovery)
             recovery_factor = 1 - (self.recoil_timer / RECOIL_DURATION)
             recovery_factor = max(0, min(1, recovery_factor))
             
-            # Apply smooth recovery using lerp
-            current_offset = lerp(self.recoil_offset, Vec3(0, 0, 0), recovery_factor * RECOIL_RECOVERY_SPEED * time.dt)
+            # Apply smooth recovery (lerp toward zero is just a scale of the offset)
+            current_offset = self.recoil_offset * (1 - recovery_factor * RECOIL_RECOVERY_SPEED * dt)
             
             # Apply recoil to camera
-            if hasattr(self.player_controller.player, 'camera_pivot'):
-                self.player_controller.player.camera_pivot.rotation_x += current_offset.x * time.dt * 60
-                self.player_controller.player.rotation_y += current_offset.y * time.dt * 60
+            if self._camera_pivot is not None:
+                self._camera_pivot.rotation_x += current_offset.x * dt * 60
+                self.player_controller.player.rotation_y += current_offset.y * dt * 60
             
             # Reduce recoil offset
-            self.recoil_offset = lerp(self.recoil_offset, Vec3(0, 0, 0), RECOIL_RECOVERY_SPEED * time.dt)
+            self.recoil_offset = self.recoil_offset * (1 - RECOIL_RECOVERY_SPEED * dt)
             
             # End recoil when timer expires
             if self.recoil_timer <= 0:
@@ -131,12 +166,10 @@ class WeaponController:
             
         # Determine recoil multiplier based on player state
         recoil_multiplier = RECOIL_MULTIPLIER_STANDING
-        if hasattr(self.player_controller, 'is_sliding') and self.player_controller.is_sliding:
+        if self.player_controller.is_sliding:
             recoil_multiplier = RECOIL_MULTIPLIER_CROUCHING
-        elif hasattr(self.player_controller, 'measured_player_velocity'):
-            velocity_magnitude = self.player_controller.measured_player_velocity.length()
-            if velocity_magnitude > 1.0:  # Player is moving
-                recoil_multiplier = RECOIL_MULTIPLIER_MOVING
+        elif self.player_controller.measured_player_velocity.length() > 1.0:  # Player is moving
+            recoil_multiplier = RECOIL_MULTIPLIER_MOVING
         
         # Generate recoil pattern
         if RECOIL_PATTERN_ENABLED:
@@ -153,127 +186,122 @@ class WeaponController:
         self.recoil_timer = RECOIL_DURATION
         
         # Immediate camera kick
-        if hasattr(self.player_controller.player, 'camera_pivot'):
-            self.player_controller.player.camera_pivot.rotation_x -= vertical_recoil * 0.3
+        if self._camera_pivot is not None:
+            self._camera_pivot.rotation_x -= vertical_recoil * 0.3
             self.player_controller.player.rotation_y += horizontal_recoil * 0.3
     
-    def shoot(self, target_spheres, game_state):
+    def shoot(self, target_manager, game_state):
         """Handle shooting mechanics with proper error handling and validation."""
         # Check if shooting is enabled
         if not SHOOTING_ENABLED:
             return
-            
-        # Validate camera exists and has required attributes
-        if not hasattr(camera, 'world_position') or not hasattr(camera, 'forward'):
-            return
         
-        # Play gunshot sound
-        try:
-            if (self.gunshot_sound and 
-                hasattr(self, 'gunshot_sound') and 
-                SFX_VOLUME > 0):
-                self.gunshot_sound.volume = min(1.0, max(0.0, SFX_VOLUME * MASTER_VOLUME))
+        # Play gunshot sound (one Audio instance, loaded and set to volume in __init__)
+        if self.gunshot_sound is not None:
+            try:
                 self.gunshot_sound.play()
-        except AttributeError:
-            pass  # Sound not available
-        except Exception as e:
-            print(f"Error playing gunshot sound: {e}")
+            except Exception as e:
+                print(f"Error playing gunshot sound: {e}")
         
         # Apply recoil effect
         self.apply_recoil()
         
-        game_state.shots_fired += 1
-
+        hit_target = False
         try:
-            hit_info = raycast(
-                origin=camera.world_position,  # Shoot from camera position (eye level)
-                direction=camera.forward,
-                distance=BULLET_RANGE,
-                ignore=[self.player_controller.player, self.player_controller.player_model]
-            )
+            origin = camera.world_position  # Shoot from camera position (eye level)
+            direction = camera.forward
             
-            # Validate hit and target
-            if (hit_info and hit_info.hit and hit_info.entity and 
-                hasattr(hit_info.entity, 'name') and hit_info.entity.name == 'target'):
-                
-                # Safely remove from target list
-                if hit_info.entity in target_spheres:
-                    target_spheres.remove(hit_info.entity)
-                
-                # Destroy the target entity
-                destroy(hit_info.entity)
+            # Analytic test against the target grid first; a shot with no target
+            # in its path needs no scene raycast at all
+            target, target_distance = target_manager.first_target_hit(origin, direction, BULLET_RANGE)
+            hit_info = None
+            if target is not None:
+                # Confirm against the scene, only as far as the target, so walls still block shots
+                hit_info = raycast(
+                    origin=origin,
+                    direction=direction,
+                    distance=target_distance + 0.1,
+                    ignore=self.player_controller._collision_ignore
+                )
+            
+            # Only a live target counts; kill_target hides it for reuse and reports whether it was one
+            if hit_info and hit_info.hit and target_manager.kill_target(hit_info.entity):
+                hit_target = True
 
                 # Update score in timed mode
                 if game_state.is_timed_mode:
-                    points_awarded = POINTS_PER_TARGET
-                    if SCORE_MULTIPLIER != 1.0:
-                        points_awarded = int(points_awarded * SCORE_MULTIPLIER)
-                    
-                    game_state.score += points_awarded
-                    game_state.hits += 1
-                    if hasattr(game_state.score_text, 'text'):
-                        game_state.score_text.text = f"Score: {game_state.score}"
-
-            # Update accuracy display
-            if game_state.is_timed_mode and hasattr(game_state.accuracy_text, 'text'):
-                accuracy = (game_state.hits / game_state.shots_fired * 100) if game_state.shots_fired > 0 else 0
-                game_state.accuracy_text.text = f"Accuracy: {accuracy:.1f}%"
+                    game_state.add_score(POINTS_PER_HIT)
                 
         except Exception as e:
             print(f"Error in shoot function: {e}")
+        
+        # Count the shot and update the accuracy display
+        game_state.on_shot(hit_target)
     
     def drop_and_respawn_gun(self):
-        """Drop current gun and spawn a new one after delay."""
+        """Drop a copy of the current gun and re-equip it after a delay."""
         self.gun_equipped = False
 
-        # Drop the current gun
-        dropped_gun = Entity(
-            model=self.gun_model.model,
-            texture=self.gun_model.texture,
-            position=self.gun_model.world_position,
-            rotation=self.gun_model.world_rotation,
-            scale=self.gun_model.scale,
-            collider='box',
-            shader=lit_with_shadows_shader,
-            double_sided=True
-        )
+        # Drop the current gun (a single dropped-gun entity is reused for every drop)
+        dropped_gun = self._get_dropped_gun()
+        dropped_gun.position = self.gun_model.world_position
+        dropped_gun.rotation = self.gun_model.world_rotation
+        dropped_gun.enabled = True
+        self.gun_model.enabled = False
 
         # Initial velocity: pop up + some of player's horizontal velocity
         horiz = Vec3(self.player_controller.measured_player_velocity.x, 0, self.player_controller.measured_player_velocity.z)
         dropped_gun.velocity = horiz * 0.9
         dropped_gun.velocity.y = GUN_POP_FORCE
 
-        # Gravity + movement for dropped gun
-        def dropped_update(e=dropped_gun):
-            if e.y > -10:
-                e.position += e.velocity * time.dt
-                e.velocity.y -= GUN_GRAVITY * time.dt
-            else:
-                e.y = -10
-        dropped_gun.update = dropped_update
-
-        # Spawn replacement gun after configured delay
-        def spawn_new_gun():
-            self.gun_model = Entity(
-                model=GUN_MODEL_PATH,
-                position=(0, 1.3, 2),
-                scale=GUN_SCALE,
-                collider=None,
+        # Bring the same gun back after configured delay (counted down in update_timers)
+        self.gun_respawn_timer = GUN_RESPAWN_TIME
+    
+    def respawn_gun(self):
+        """Re-equip the held gun after a drop."""
+        self.gun_respawn_timer = None
+        self.gun_model.position = GUN_OFFSET
+        self.gun_model.rotation = (0, 0, 0)
+        self._gun_pitch = 0.0
+        self.gun_model.enabled = True
+        
+        # Reset recoil state for new gun
+        self.recoil_timer = 0
+        self.recoil_offset = Vec3(0, 0, 0)
+        
+        self.gun_equipped = True
+    
+    def _get_dropped_gun(self):
+        """Return the reusable dropped-gun entity, creating it on the first drop."""
+        if self._dropped_gun is None:
+            # A copy of the cached model node shares its geometry with the held gun,
+            # instead of re-parenting (and so stealing) the held gun's own model node
+            dropped_gun = Entity(
+                model=copy(get_model(GUN_MODEL_PATH)),
+                texture=get_texture(GUN_TEXTURE_PATH),
+                scale=self.gun_model.scale,
+                collider='box',
                 shader=lit_with_shadows_shader,
                 double_sided=True,
-                parent=self.player_controller.player
+                enabled=False
             )
-            self.gun_model.texture = GUN_TEXTURE_PATH
-            self.barrel.parent = self.gun_model
-            self.barrel.position = (0, 0.1, 2.2)
-            
-            # Reset recoil state for new gun
-            self.recoil_timer = 0
-            self.recoil_offset = Vec3(0, 0, 0)
-            
-            self.gun_equipped = True
-
-        invoke(spawn_new_gun, delay=GUN_RESPAWN_TIME)
+            dropped_gun.velocity = Vec3(0, 0, 0)
+            self._dropped_gun = dropped_gun
+        return self._dropped_gun
+    
+    def update_dropped_gun(self, dt):
+        """Move the dropped gun under gravity; ticked from update_timers, not per entity."""
+        e = self._dropped_gun
+        if e is None or not e.enabled:
+            return
+        
+        # Hidden once it falls out of the map
+        if e.y > -10:
+            e.position += e.velocity * dt
+            e.velocity.y -= GUN_GRAVITY * dt
+        else:
+            e.y = -10
+            e.enabled = False
     
     def fire_grapple(self):
         """Fire grappling hook in the direction the player is looking."""
@@ -290,7 +318,7 @@ class WeaponController:
                 origin=camera.world_position,
                 direction=camera.forward,
                 distance=GRAPPLE_RANGE,
-                ignore=[self.player_controller.player, self.player_controller.player_model]
+                ignore=self.player_controller._collision_ignore
             )
             
             if hit_info and hit_info.hit and hit_info.entity:
@@ -387,7 +415,7 @@ class WeaponController:
             # Add some upward force to counteract remaining gravity while grappling
             if direction.y > 0:  # Only if grappling upward
                 # Compensate for reduced but not eliminated gravity
-                gravity_compensation = (1.0 - GRAPPLE_GRAVITY_REDUCTION) * 9.8 * PLAYER_GRAVITY * time.dt
+                gravity_compensation = GRAPPLE_GRAVITY_COMPENSATION * time.dt
                 self.player_controller.movement_velocity.y += gravity_compensation
                 # Add additional upward pull force
                 self.player_controller.movement_velocity.y += abs(direction.y) * GRAPPLE_PULL_FORCE * 0.3 * time.dt
@@ -0,0 +1,127 @@
+"""
+Asset Cache
+===========
+
+Cached model and texture loading so repeated spawns never hit the disk,
+plus background preloading of the game's assets at startup.
+"""
+
+from ursina import *
+from config import *
+from pathlib import Path
+import queue
+import threading
+
+# ===============================================
+# === ASSET CACHE ===============================
+# ===============================================
+
+# Loaded handles by name; failed loads are never stored, so they are retried
+_models = {}
+_textures = {}
+
+def get_model(name):
+    """
+    Load a model once and return the cached handle on later calls.
+
+    load_model only searches the asset folder, so names it can't find there
+    (Ursina's built-in meshes such as 'sphere') are looked up again in the
+    engine's internal models folder.
+
+    The returned model can only be parented to one entity at a time,
+    so callers creating several entities should pass copy(get_model(name)).
+
+    Args:
+        name (str): Model name or relative path (e.g. 'sphere')
+
+    Returns:
+        Mesh/NodePath or None if the model could not be loaded
+    """
+    model = _models.get(name)
+    if model is None:
+        model = load_model(name)
+        if model is None:
+            model = load_model(name, path=application.internal_models_compressed_folder)
+        if model is not None:
+            _models[name] = model
+    return model
+
+def get_texture(name):
+    """
+    Load a texture once and return the shared handle on later calls.
+
+    Args:
+        name (str): Texture name or relative path
+
+    Returns:
+        Texture or None if the texture could not be loaded
+    """
+    texture = _textures.get(name)
+    if texture is None:
+        texture = load_texture(name)
+        if texture is not None:
+            _textures[name] = texture
+    return texture
+
+# ===============================================
+# === ASSET PRELOADING ==========================
+# ===============================================
+
+# Every asset the game loads during play: (kind, name). Built-in meshes such as
+# 'sphere' have no file to read ahead, so they are left to load on first use.
+ASSET_MANIFEST = (
+    ('model', './assets/tutorial_map.obj'),
+    ('texture', SKYBOX_TEXTURE),
+    ('model', GUN_MODEL_PATH),
+    ('texture', GUN_TEXTURE_PATH),
+)
+
+# Assets whose files have been read and are ready for the main thread to load;
+# the worker puts None once the whole manifest has been read
+_preload_queue = queue.Queue()
+_preload_done = False
+
+def _prefetch(manifest):
+    """Read asset files on a worker thread so the main thread loads from warm cache."""
+    for kind, name in manifest:
+        path = Path(name)
+        if path.suffix and path.is_file():
+            try:
+                path.read_bytes()
+            except OSError:
+                pass  # Main thread load will report the missing asset
+        _preload_queue.put((kind, name))
+    _preload_queue.put(None)
+
+def start_preload(manifest=ASSET_MANIFEST):
+    """
+    Start reading all manifest assets on a background thread.
+
+    Args:
+        manifest (tuple): (kind, name) pairs where kind is 'model' or 'texture'
+
+    Returns:
+        threading.Thread: The started daemon thread
+    """
+    thread = threading.Thread(target=_prefetch, args=(manifest,), name='asset-preload', daemon=True)
+    thread.start()
+    return thread
+
+def finish_preload():
+    """
+    Load every prefetched asset on the main thread, waiting for the worker as needed.
+
+    Panda3D uploads must happen on the main thread, so this is called once at
+    startup before the game systems are created; each asset is loaded as soon
+    as the worker has read it, while the worker reads the next one. Later calls
+    return immediately.
+    """
+    global _preload_done
+    while not _preload_done:
+        item = _preload_queue.get()
+        if item is None:
+            _preload_done = True
+        elif item[0] == 'model':
+            get_model(item[1])
+        else:
+            get_texture(item[1])
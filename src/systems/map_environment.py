@@ -7,8 +7,48 @@ Map and Environment
 
 from ursina import *
 from ursina.shaders import lit_with_shadows_shader
-from panda3d.core import Texture
+from panda3d.core import CullFaceAttrib, OmniBoundingVolume
 from config import *
+from systems.assets import get_model, get_texture
+
+# ===============================================
+# === SKYBOX SHADER =============================
+# ===============================================
+
+# Draws a unit cube around the camera by dropping the view translation,
+# so the skybox never needs repositioning. The equirectangular skybox
+# texture is sampled by view direction. Ursina runs Panda3D as y-up-left
+# (x right, y up, z forward): elevation comes from y, and azimuth is measured
+# from +z toward +x, so the image centre is straight ahead at the start and
+# reads left to right when turning right, as it did on the old inside-out sphere.
+skybox_shader = Shader(name='skybox_shader', language=Shader.GLSL, vertex='''#version 140
+
+uniform mat4 p3d_ProjectionMatrix;
+uniform mat4 p3d_ViewMatrix;
+in vec4 p3d_Vertex;
+out vec3 view_dir;
+
+void main() {
+    view_dir = p3d_Vertex.xyz;
+    vec4 pos = p3d_ProjectionMatrix * mat4(mat3(p3d_ViewMatrix)) * vec4(p3d_Vertex.xyz, 1.0);
+    gl_Position = pos.xyww;
+}
+''',
+fragment='''#version 140
+
+uniform sampler2D p3d_Texture0;
+uniform vec4 p3d_ColorScale;
+in vec3 view_dir;
+out vec4 fragColor;
+
+const float PI = 3.14159265;
+
+void main() {
+    vec3 d = normalize(view_dir);
+    vec2 uv = vec2(atan(d.x, d.z) / (2.0 * PI) + 0.5, asin(clamp(d.y, -1.0, 1.0)) / PI + 0.5);
+    fragColor = textureLod(p3d_Texture0, uv, 0.0) * p3d_ColorScale;
+}
+''')
 
 # ===============================================
 # === MAP AND ENVIRONMENT =======================
@@ -18,20 +58,20 @@ class MapEnvironment:
     def __init__(self):
         # Main map entity with enhanced texture settings
         self.model_entity = Entity(
-            model='./assets/tutorial_map.obj',
+            model=get_model('./assets/tutorial_map.obj'),
             #texture='./assets/block_texture.jpg',
             color=color.white,
             scale=1,
-            collider='mesh',
             position=(0, 0, 0),
             #texture_scale=(8, 8),
             shader=lit_with_shadows_shader,
             double_sided=True
         )
         
-        # Apply texture softening to map if enabled
-        if TEXTURE_SOFTENING:
-            self.apply_texture_enhancements()
+        # The map never moves: bake its node transforms into the vertices and merge
+        # its geoms once, then build the mesh collider from the flattened geometry
+        self.model_entity.model.flattenStrong()
+        self.model_entity.collider = 'mesh'
 
         # Skybox setup
         self.skybox = None
@@ -45,24 +85,25 @@ class MapEnvironment:
     def create_skybox(self):
         """Create skybox with error handling for missing textures."""
         try:
-            # Method 1: Sphere-based skybox (most common and reliable)
+            # Shader-based skybox: unit cube that always surrounds the camera
             self.skybox = Entity(
-                model='sphere',
-                texture=SKYBOX_TEXTURE,
-                scale=SKYBOX_SCALE,
+                model='cube',
+                texture=get_texture(SKYBOX_TEXTURE),
+                scale=1,
                 color=SKYBOX_COLOR,
-                double_sided=True,
-                unlit=True,  # Skybox shouldn't be affected by lighting
-                render_queue=-1,  # Render behind everything else
-                always_on_top=False
+                unlit=True,  # No lighting, and hidden from the shadow camera
+                shader=skybox_shader
             )
             
-            # Make skybox follow camera position (but not rotation)
-            def update_skybox():
-                if self.skybox and camera:
-                    self.skybox.position = camera.world_position
+            # Only the inside faces are ever seen, so cull the outward-facing ones
+            self.skybox.setAttrib(CullFaceAttrib.makeReverse())
             
-            self.skybox.update = update_skybox
+            # Draw first, behind everything, and never frustum-cull it
+            self.skybox.setBin('background', 0)
+            self.skybox.setDepthTest(False)
+            self.skybox.setDepthWrite(False)
+            self.skybox.node().setBounds(OmniBoundingVolume())
+            self.skybox.node().setFinal(True)
             
         except Exception as e:
             print(f"Warning: Could not create skybox with texture {SKYBOX_TEXTURE}: {e}")
@@ -76,10 +117,10 @@ class MapEnvironment:
                 model='sphere',
                 scale=SKYBOX_SCALE,
                 color=color.rgb(135, 206, 235),  # Sky blue
-                double_sided=True,
                 unlit=True,
                 render_queue=-1
             )
+            self.skybox.setAttrib(CullFaceAttrib.makeReverse())
             
             def update_skybox():
                 if self.skybox and camera:
@@ -91,55 +132,6 @@ class MapEnvironment:
             print(f"Warning: Could not create fallback skybox: {e}")
             self.skybox = None
     
-    def apply_texture_enhancements(self):
-        """Apply texture softening and quality enhancements to environment."""
-        try:
-            if self.model_entity:
-                # Try multiple methods to apply texture enhancements
-                texture_applied = False
-                
-                # Method 1: Direct texture access
-                if hasattr(self.model_entity, 'texture') and self.model_entity.texture:
-                    try:
-                        if TEXTURE_FILTERING == 'linear':
-                            # Try different Panda3D API versions
-                            texture = self.model_entity.texture
-                            
-                            # Try newer API first
-                            if hasattr(texture, 'setMagfilter'):
-                                texture.setMagfilter(Texture.FTLinear)
-                                if MIPMAPPING_ENABLED:
-                                    texture.setMinfilter(Texture.FTLinearMipmapLinear)
-                                else:
-                                    texture.setMinfilter(Texture.FTLinear)
-                                texture_applied = True
-                            
-                            # Apply anisotropic filtering if available
-                            if ANISOTROPIC_FILTERING > 0 and hasattr(texture, 'setAnisotropicDegree'):
-                                texture.setAnisotropicDegree(ANISOTROPIC_FILTERING)
-                    except:
-                        pass
-                
-                # Method 2: Use Ursina's texture system
-                if not texture_applied and hasattr(self.model_entity, 'model'):
-                    try:
-                        # Apply through Ursina's model system
-                        if TEXTURE_FILTERING == 'linear':
-                            # Ursina automatically handles texture filtering for models
-                            pass
-                    except:
-                        pass
-                
-                if texture_applied:
-                    print("✅ Enhanced texture filtering applied to environment")
-                else:
-                    # Global settings are still active, so this is fine
-                    pass
-                
-        except Exception:
-            # Texture enhancements are optional - fail silently
-            pass
-    
     def show_game(self):
         """Show all game environment elements."""
         self.model_entity.enabled = True
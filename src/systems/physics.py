@@ -8,20 +8,39 @@ Movement physics, collision handling, and momentum system.
 from ursina import *
 from config import *
 from utils import *
+from systems.physics_numeric import step_momentum, step_airborne
 import math
 
 # ===============================================
 # === PHYSICS SYSTEM ===========================
 # ===============================================
 
+# Gravity acceleration used for vertical integration (config is fixed at startup)
+GRAVITY_ACCEL = 9.8 * PLAYER_GRAVITY
+# Initial velocity that reaches PLAYER_JUMP_HEIGHT: v = sqrt(2 * g * h)
+JUMP_VELOCITY = math.sqrt(2 * GRAVITY_ACCEL * PLAYER_JUMP_HEIGHT)
+
+# Axis vectors shared by the collision raycasts
+_UP = Vec3(0, 1, 0)
+_FORWARD = Vec3(0, 0, 1)
+
+# Directions tried when pushing the player out of geometry
+PUSH_OUT_DIRECTIONS = (
+    Vec3(1, 0, 0),   # Right
+    Vec3(-1, 0, 0),  # Left
+    Vec3(0, 0, 1),   # Forward
+    Vec3(0, 0, -1),  # Back
+    _UP,             # Up
+)
+
 def apply_horizontal_movement_with_collision(player_controller, horizontal_movement):
     """Apply horizontal movement with enhanced collision detection to prevent clipping."""
-    if horizontal_movement.length() <= 0:
+    movement_distance = horizontal_movement.length()
+    if movement_distance <= 0:
         return
     
     # Break down large movements into smaller steps to prevent clipping
     max_step_size = MAX_MOVEMENT_STEP
-    movement_distance = horizontal_movement.length()
     
     if movement_distance > max_step_size:
         # Break into multiple steps
@@ -34,31 +53,40 @@ def apply_horizontal_movement_with_collision(player_controller, horizontal_movem
         # Single step movement
         apply_single_movement_step(player_controller, horizontal_movement)
 
+# Ray offsets around the player used for movement collision checks
+MOVEMENT_CHECK_OFFSETS = (
+    Vec3(0, 0, 0),           # Center
+    Vec3(0.3, 0, 0),         # Right
+    Vec3(-0.3, 0, 0),        # Left  
+    Vec3(0, 0, 0.3),         # Forward
+    Vec3(0, 0, -0.3),        # Back
+    Vec3(0, 0.5, 0),         # Upper center
+)
+
+# Batched movement rays (created on first use)
+_movement_rays = None
+
 def apply_single_movement_step(player_controller, movement):
     """Apply a single movement step with collision detection."""
-    # Enhanced collision check with multiple rays
+    global _movement_rays
+    if _movement_rays is None:
+        _movement_rays = RayBatch(len(MOVEMENT_CHECK_OFFSETS))
+    
+    # Enhanced collision check with multiple rays, cast in a single traversal
     collision_detected = False
     collision_normal = None
     
-    # Check collision from multiple points around the player
-    check_points = [
-        Vec3(0, 0, 0),           # Center
-        Vec3(0.3, 0, 0),         # Right
-        Vec3(-0.3, 0, 0),        # Left  
-        Vec3(0, 0, 0.3),         # Forward
-        Vec3(0, 0, -0.3),        # Back
-        Vec3(0, 0.5, 0),         # Upper center
-    ]
+    origin = player_controller.player.position + PLAYER_CENTER_OFFSET
+    hits = _movement_rays.cast(
+        origins=[origin + offset for offset in MOVEMENT_CHECK_OFFSETS],
+        direction=movement.normalized(),
+        distance=movement.length() + 0.2 + COLLISION_BUFFER,  # Extra safety margin
+        ignore=player_controller._collision_ignore
+    )
     
-    for offset in check_points:
-        collision_check = check_collision(
-            origin=player_controller.player.position + offset,
-            direction=movement.normalized(),
-            distance=movement.length() + 0.2,  # Extra safety margin
-            ignore_list=[player_controller.player, player_controller.player_model]
-        )
-        
-        if collision_check and collision_check.hit:
+    # First ray (in offset order) that hit decides the collision normal
+    for collision_check in hits:
+        if collision_check:
             collision_detected = True
             collision_normal = collision_check.normal
             break
@@ -92,42 +120,6 @@ def apply_single_movement_step(player_controller, movement):
 
 def handle_momentum_movement(player_controller, target_max_speed):
     """Handle momentum-based ground movement."""
-    # Input direction from WASD / arrow keys
-    input_dir = Vec3(
-        held_keys['d'] - held_keys['a'],  # right-left
-        0,
-        held_keys['w'] - held_keys['s']   # forward-back
-    )
-    if input_dir.length() > 0:
-        input_dir = input_dir.normalized()
-
-    # Build world-space move direction ignoring vertical component
-    if input_dir.length() > 0:
-        move_dir_world = (camera.forward * input_dir.z + camera.right * input_dir.x)
-        move_dir_world.y = 0
-        if move_dir_world.length() > 0:
-            move_dir_world = move_dir_world.normalized()
-    else:
-        move_dir_world = Vec3(0, 0, 0)
-
-    # Apply acceleration when input provided
-    if move_dir_world.length() > 0:
-        player_controller.movement_velocity += move_dir_world * ACCELERATION * time.dt
-    else:
-        # Apply friction to horizontal velocity
-        horiz = Vec3(player_controller.movement_velocity.x, 0, player_controller.movement_velocity.z)
-        if horiz.length() > 0:
-            friction_force = horiz.normalized() * FRICTION * time.dt
-            if friction_force.length() >= horiz.length():
-                player_controller.movement_velocity.x = 0
-                player_controller.movement_velocity.z = 0
-            else:
-                player_controller.movement_velocity.x -= friction_force.x
-                player_controller.movement_velocity.z -= friction_force.z
-
-    # Cap horizontal speed (respect sprint target, but allow dash and jump speed boosts)
-    horiz_speed = math.sqrt(player_controller.movement_velocity.x**2 + player_controller.movement_velocity.z**2)
-    
     # Allow higher speeds temporarily after dashing or jumping
     speed_multiplier = 1.0
     if player_controller.dash_timer > (DASH_COOLDOWN - 0.5):
@@ -137,20 +129,22 @@ def handle_momentum_movement(player_controller, target_max_speed):
     
     effective_max_speed = target_max_speed * speed_multiplier
     
-    if horiz_speed > effective_max_speed:
-        scale = effective_max_speed / horiz_speed
-        player_controller.movement_velocity.x *= scale
-        player_controller.movement_velocity.z *= scale
+    # Acceleration, friction and speed cap run in the numeric kernel
+    velocity = player_controller.movement_velocity
+    forward = camera.forward
+    right = camera.right
+    velocity.x, velocity.z = step_momentum(
+        velocity.x, velocity.z,
+        player_controller.input_x, player_controller.input_z,
+        forward.x, forward.z, right.x, right.z,
+        time.dt, ACCELERATION, FRICTION, effective_max_speed
+    )
 
 def handle_jumping(player_controller):
     """Handle jumping physics with enhanced feel."""
     # Check for jump input with buffering and coyote time
     if player_controller.handle_jump_input():
-        # gravity acceleration used for vertical integration
-        gravity_accel = 9.8 * PLAYER_GRAVITY
-        # required initial velocity to reach desired jump height: v = sqrt(2 * g * h)
-        jump_vel = math.sqrt(2 * gravity_accel * PLAYER_JUMP_HEIGHT)
-        player_controller.movement_velocity.y = jump_vel
+        player_controller.movement_velocity.y = JUMP_VELOCITY
         player_controller.is_airborne = True
         
         # Consume the jump input
@@ -164,7 +158,7 @@ def handle_jumping(player_controller):
 
 def handle_airborne_movement(player_controller):
     """Handle movement when player is airborne."""
-    gravity_accel = 9.8 * PLAYER_GRAVITY
+    gravity_accel = GRAVITY_ACCEL
     
     # Check if player is grappling and apply reduced gravity
     try:
@@ -178,69 +172,53 @@ def handle_airborne_movement(player_controller):
     except (ImportError, AttributeError):
         pass  # Use normal gravity if grapple system not available
     
-    player_controller.movement_velocity.y -= gravity_accel * time.dt
-    
-    # Enhanced air control for smoother feel
-    input_dir = Vec3(
-        held_keys['d'] - held_keys['a'],  # right-left
-        0,
-        held_keys['w'] - held_keys['s']   # forward-back
+    # Gravity, air control and air resistance run in the numeric kernel
+    velocity = player_controller.movement_velocity
+    forward = camera.forward
+    right = camera.right
+    dt = time.dt
+    vx, vy, vz = step_airborne(
+        velocity.x, velocity.y, velocity.z,
+        player_controller.input_x, player_controller.input_z,
+        forward.x, forward.z, right.x, right.z,
+        dt, gravity_accel, AIR_ACCELERATION * AIR_CONTROL_MULTIPLIER, AIR_FRICTION
     )
-    if input_dir.length() > 0:
-        input_dir = input_dir.normalized()
-        
-        # Build world-space move direction
-        move_dir_world = (camera.forward * input_dir.z + camera.right * input_dir.x)
-        move_dir_world.y = 0
-        if move_dir_world.length() > 0:
-            move_dir_world = move_dir_world.normalized()
-            
-            # Apply air control (reduced acceleration in air)
-            air_accel = AIR_ACCELERATION * AIR_CONTROL_MULTIPLIER * time.dt
-            player_controller.movement_velocity += move_dir_world * air_accel
-    
-    # Apply air resistance (lighter than ground friction)
-    horiz = Vec3(player_controller.movement_velocity.x, 0, player_controller.movement_velocity.z)
-    if horiz.length() > 0:
-        air_friction_force = horiz.normalized() * AIR_FRICTION * time.dt
-        if air_friction_force.length() < horiz.length():
-            player_controller.movement_velocity.x -= air_friction_force.x
-            player_controller.movement_velocity.z -= air_friction_force.z
+    velocity.x, velocity.y, velocity.z = vx, vy, vz
     
-    # Apply movement with collision checking for airborne movement
-    full_movement = player_controller.movement_velocity * time.dt
+    # This frame's movement as scalars; a Vec3 is only built for the collision sweep
+    step_x, step_y, step_z = vx * dt, vy * dt, vz * dt
     
     # Check horizontal movement first with enhanced collision detection
-    horizontal_movement = Vec3(full_movement.x, 0, full_movement.z)
-    if horizontal_movement.length() > 0:
-        apply_horizontal_movement_with_collision(player_controller, horizontal_movement)
+    if step_x or step_z:
+        apply_horizontal_movement_with_collision(player_controller, Vec3(step_x, 0, step_z))
     
     # Apply vertical movement separately (for gravity/jumping)
-    vertical_movement = Vec3(0, full_movement.y, 0)
-    if vertical_movement.y != 0:
+    if step_y != 0:
         # Check for ceiling collision when moving up
-        if vertical_movement.y > 0:
+        if step_y > 0:
             ceiling_check = raycast(
                 origin=player_controller.player.position + HEAD_HEIGHT_OFFSET,
-                direction=Vec3(0, 1, 0),
-                distance=abs(vertical_movement.y) + 0.1,
-                ignore=[player_controller.player, player_controller.player_model]
+                direction=_UP,
+                distance=step_y + 0.1,
+                ignore=player_controller._collision_ignore
             )
             if ceiling_check and ceiling_check.hit:
-                player_controller.movement_velocity.y = 0
+                velocity.y = 0
             else:
-                player_controller.player.position += vertical_movement
+                player_controller.player.y += step_y
         else:
             # Moving down (gravity), apply normally
-            player_controller.player.position += vertical_movement
+            player_controller.player.y += step_y
 
 def handle_grounded_movement(player_controller):
     """Handle movement when player is on ground."""
     # Check if player is stuck in geometry and correct position
     correct_player_position(player_controller)
     
-    horizontal_movement = Vec3(player_controller.movement_velocity.x, 0, player_controller.movement_velocity.z)
-    step_size = horizontal_movement * time.dt
+    # One Vec3 for the step, scaled as scalars rather than via an intermediate Vec3
+    velocity = player_controller.movement_velocity
+    dt = time.dt
+    step_size = Vec3(velocity.x * dt, 0, velocity.z * dt)
     
     apply_horizontal_movement_with_collision(player_controller, step_size)
     
@@ -252,29 +230,21 @@ def correct_player_position(player_controller):
     # Check if player is inside a wall
     center_check = raycast(
         origin=player_controller.player.position,
-        direction=Vec3(0, 0, 1),  # Check forward
+        direction=_FORWARD,  # Check forward
         distance=0.1,
-        ignore=[player_controller.player, player_controller.player_model]
+        ignore=player_controller._collision_ignore
     )
     
     if center_check and center_check.hit and center_check.distance < 0.05:
         # Player might be inside geometry - try to push them out
-        push_directions = [
-            Vec3(1, 0, 0),   # Right
-            Vec3(-1, 0, 0),  # Left
-            Vec3(0, 0, 1),   # Forward
-            Vec3(0, 0, -1),  # Back
-            Vec3(0, 1, 0),   # Up
-        ]
-        
-        for direction in push_directions:
+        for direction in PUSH_OUT_DIRECTIONS:
             # Try pushing in this direction
             push_distance = 1.0
             push_check = raycast(
                 origin=player_controller.player.position,
                 direction=direction,
                 distance=push_distance,
-                ignore=[player_controller.player, player_controller.player_model]
+                ignore=player_controller._collision_ignore
             )
             
             if not push_check or not push_check.hit or push_check.distance > 0.5:
@@ -0,0 +1,202 @@
+"""
+Physics Kernels
+===============
+
+Scalar velocity math for the per-frame movement physics.
+Compiled with Numba when it is installed, plain Python otherwise.
+"""
+
+import math
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+def _float_signature(n_args, n_returns):
+    """Numba signature string for an all-float64 scalar kernel."""
+    return f"UniTuple(float64, {n_returns})({', '.join(['float64'] * n_args)})"
+
+# ===============================================
+# === MOVEMENT KERNELS ==========================
+# ===============================================
+
+# Explicit signatures make Numba compile every kernel at import, not on the
+# first gameplay frame, and coerce int inputs (held_keys, int config values)
+# to float64 instead of compiling extra specializations mid-game.
+
+@njit(_float_signature(6, 2), cache=True)
+def world_move_direction(inp_x, inp_z, fwd_x, fwd_z, right_x, right_z):
+    """
+    Convert WASD input into a normalized horizontal world direction.
+
+    Returns:
+        tuple: (dir_x, dir_z), both 0.0 when there is no usable input
+    """
+    inp_len_sq = inp_x * inp_x + inp_z * inp_z
+    if inp_len_sq <= 0.0:
+        return 0.0, 0.0
+
+    inv_len = 1.0 / math.sqrt(inp_len_sq)
+    unit_x = inp_x * inv_len
+    unit_z = inp_z * inv_len
+
+    dir_x = fwd_x * unit_z + right_x * unit_x
+    dir_z = fwd_z * unit_z + right_z * unit_x
+    dir_len_sq = dir_x * dir_x + dir_z * dir_z
+    if dir_len_sq <= 0.0:
+        return 0.0, 0.0
+
+    inv_len = 1.0 / math.sqrt(dir_len_sq)
+    return dir_x * inv_len, dir_z * inv_len
+
+@njit(_float_signature(12, 2), cache=True)
+def step_momentum(vx, vz, inp_x, inp_z, fwd_x, fwd_z, right_x, right_z,
+                  dt, accel, friction, max_speed):
+    """
+    Advance ground momentum: accelerate with input, apply friction without it,
+    then cap horizontal speed.
+
+    Returns:
+        tuple: New (vx, vz)
+    """
+    dir_x, dir_z = world_move_direction(inp_x, inp_z, fwd_x, fwd_z, right_x, right_z)
+
+    if dir_x != 0.0 or dir_z != 0.0:
+        vx += dir_x * accel * dt
+        vz += dir_z * accel * dt
+    else:
+        speed_sq = vx * vx + vz * vz
+        if speed_sq != 0.0:
+            speed = math.sqrt(speed_sq)
+            friction_step = friction * dt
+            if friction_step >= speed:
+                vx = 0.0
+                vz = 0.0
+            else:
+                scale = (speed - friction_step) / speed
+                vx *= scale
+                vz *= scale
+
+    # Speed cap: compare squared speeds, so the common under-cap case needs no sqrt
+    speed_sq = vx * vx + vz * vz
+    if speed_sq > max_speed * max_speed:
+        scale = max_speed / math.sqrt(speed_sq)
+        vx *= scale
+        vz *= scale
+    return vx, vz
+
+@njit(_float_signature(13, 3), cache=True)
+def step_airborne(vx, vy, vz, inp_x, inp_z, fwd_x, fwd_z, right_x, right_z,
+                  dt, gravity, air_accel, air_friction):
+    """
+    Advance airborne velocity: gravity, reduced air control and air resistance.
+
+    Returns:
+        tuple: New (vx, vy, vz)
+    """
+    vy -= gravity * dt
+
+    dir_x, dir_z = world_move_direction(inp_x, inp_z, fwd_x, fwd_z, right_x, right_z)
+    vx += dir_x * air_accel * dt
+    vz += dir_z * air_accel * dt
+
+    speed_sq = vx * vx + vz * vz
+    if speed_sq != 0.0:
+        speed = math.sqrt(speed_sq)
+        friction_step = air_friction * dt
+        if friction_step < speed:
+            scale = (speed - friction_step) / speed
+            vx *= scale
+            vz *= scale
+
+    return vx, vy, vz
+
+@njit(_float_signature(9, 4), cache=True)
+def step_slide_slope(dir_x, dir_y, dir_z, speed, normal_x, normal_y, normal_z,
+                     dt, gravity_force):
+    """
+    Steer a slide toward the downhill direction of the ground under it and
+    gain speed from the slope.
+
+    Returns:
+        tuple: New slide direction (dir_x, dir_y, dir_z) and speed
+    """
+    down_x = -normal_x
+    down_z = -normal_z
+    down_len_sq = down_x * down_x + down_z * down_z
+    if down_len_sq > 0.0:
+        inv_len = 1.0 / math.sqrt(down_len_sq)
+        down_x *= inv_len
+        down_z *= inv_len
+
+    # Same blend as lerp(direction, downhill, dt * 2)
+    t = dt * 2.0
+    dir_x += (down_x - dir_x) * t
+    dir_y -= dir_y * t
+    dir_z += (down_z - dir_z) * t
+
+    speed += gravity_force * (1.0 - normal_y) * dt
+    return dir_x, dir_y, dir_z, speed
+
+# ===============================================
+# === WALL RUNNING KERNELS ======================
+# ===============================================
+
+@njit(_float_signature(11, 3), cache=True)
+def step_wall_run(fwd_x, fwd_y, fwd_z, wall_x, wall_y, wall_z, dt,
+                  run_speed, tangent_speed, climb_speed, stick_force):
+    """
+    Advance one wall running frame: run along the wall in the look direction,
+    stick to the wall, and climb/descend when looking up or down.
+
+    Returns:
+        tuple: New (vx, vz) and the vertical position change dy
+    """
+    # Vertical control only outside the +-0.1 look dead zone
+    dy = 0.0
+    if fwd_y > 0.1 or fwd_y < -0.1:
+        climb = fwd_y * climb_speed
+        if abs(climb) > 0.01:
+            dy = climb * dt
+
+    look_len_sq = fwd_x * fwd_x + fwd_z * fwd_z
+    if look_len_sq > 1e-12:
+        inv_len = 1.0 / math.sqrt(look_len_sq)
+        look_x = fwd_x * inv_len
+        look_z = fwd_z * inv_len
+
+        # Project the horizontal look direction onto the wall surface
+        along_normal = look_x * wall_x + look_z * wall_z
+        run_x = look_x - wall_x * along_normal
+        run_y = -wall_y * along_normal
+        run_z = look_z - wall_z * along_normal
+        run_len_sq = run_x * run_x + run_y * run_y + run_z * run_z
+        if run_len_sq > 1e-12:
+            scale = run_speed / math.sqrt(run_len_sq)
+            vx = run_x * scale
+            vz = run_z * scale
+        else:
+            vx = 0.0
+            vz = 0.0
+    else:
+        # Looking straight up/down: run along the wall tangent at reduced speed
+        tangent_len_sq = wall_x * wall_x + wall_z * wall_z
+        if tangent_len_sq > 1e-12:
+            scale = tangent_speed / math.sqrt(tangent_len_sq)
+            vx = -wall_z * scale
+            vz = wall_x * scale
+        else:
+            vx = 0.0
+            vz = 0.0
+
+    # Inward force to stick to the wall
+    stick = -stick_force * dt
+    return vx + wall_x * stick, vz + wall_z * stick, dy
@@ -6,16 +6,138 @@ Target spawning, management, and respawning mechanics.
 """
 
 from ursina import *
+from panda3d.core import CollisionBox
 from config import *
-from random import uniform
+from systems.assets import get_model
+from random import Random
 
 # ===============================================
 # === TARGET SYSTEM =============================
 # ===============================================
 
+# Shared collision solid - created lazily because the engine must be running
+_shared_collision_box = None
+
+def get_target_model():
+    """Return a copy of the cached sphere model (geometry data is shared)."""
+    # 'sphere' is an Ursina built-in; get_model resolves it from the engine's
+    # internal models folder, independent of anything else loaded before
+    model = get_model('sphere')
+    if model is None:
+        raise RuntimeError("Could not load the built-in 'sphere' model for targets")
+    return copy(model)
+
+def get_target_collider(entity):
+    """Attach the shared unit collision box to a target entity."""
+    global _shared_collision_box
+    if _shared_collision_box is None:
+        _shared_collision_box = CollisionBox(Vec3(0, 0, 0), 0.5, 0.5, 0.5)
+    return Collider(entity, _shared_collision_box)
+
+# Number of targets kept alive on the course
+MIN_TARGET_COUNT = 10
+
+# Spawn area on the target wall (x is fixed, y/z are random)
+TARGET_SPAWN_X = 62
+TARGET_SPAWN_Y_RANGE = (11, 20)
+TARGET_SPAWN_Z_RANGE = (-10, 10)
+
+# Pre-rolled spawn positions, refilled in one batch when exhausted
+SPAWN_POSITION_POOL_SIZE = 256
+_rng = Random()
+_spawn_positions = []
+
+def seed_spawn_positions(seed=None):
+    """Reseed the spawn RNG and discard pre-rolled positions (for reproducible runs)."""
+    _rng.seed(seed)
+    _spawn_positions.clear()
+
+def _roll_spawn_positions():
+    """Roll one batch of SPAWN_POSITION_POOL_SIZE spawn positions."""
+    rand = _rng.random
+    y_low, y_high = TARGET_SPAWN_Y_RANGE
+    z_low, z_high = TARGET_SPAWN_Z_RANGE
+    y_span = y_high - y_low
+    z_span = z_high - z_low
+    return [
+        (TARGET_SPAWN_X, y_low + y_span * rand(), z_low + z_span * rand())
+        for _ in range(SPAWN_POSITION_POOL_SIZE)
+    ]
+
+def next_spawn_position():
+    """Take the next pre-rolled (x, y, z) spawn position."""
+    if not _spawn_positions:
+        _spawn_positions.extend(_roll_spawn_positions())
+    return _spawn_positions.pop()
+
+def take_spawn_positions(count):
+    """
+    Take the next count pre-rolled spawn positions in one slice.
+    
+    Yields the same sequence as calling next_spawn_position() count times.
+    """
+    while len(_spawn_positions) < count:
+        # New batches go underneath, so leftover positions are still used first
+        _spawn_positions[:0] = _roll_spawn_positions()
+    batch = _spawn_positions[-count:]
+    del _spawn_positions[-count:]
+    batch.reverse()
+    return batch
+
+# ===============================================
+# === TARGET HIT TESTING ========================
+# ===============================================
+
+# Half extent of a target's unit collision box
+TARGET_HALF_SIZE = 0.5
+
+# Live targets are bucketed on the target wall's (y, z) plane in cells of this size
+TARGET_GRID_CELL = 4.0
+
+def _grid_cell(y, z):
+    """Grid cell holding a target centred at (y, z) on the target wall."""
+    return (int(y // TARGET_GRID_CELL), int(z // TARGET_GRID_CELL))
+
+def _ray_box_entry(origin, direction, center, half_size, max_distance):
+    """
+    Slab test of a ray against an axis-aligned box.
+    
+    Returns:
+        float: Distance along the ray where it enters the box, or None on a miss
+    """
+    t_near, t_far = 0.0, max_distance
+    for o, d, c in zip(origin, direction, center):
+        if d == 0.0:
+            if abs(o - c) > half_size:
+                return None
+            continue
+        t_a = (c - half_size - o) / d
+        t_b = (c + half_size - o) / d
+        if t_a > t_b:
+            t_a, t_b = t_b, t_a
+        if t_a > t_near:
+            t_near = t_a
+        if t_b < t_far:
+            t_far = t_b
+        if t_near > t_far:
+            return None
+    return t_near
+
+# ===============================================
+# === TARGET MANAGER ============================
+# ===============================================
+
 class TargetManager:
     def __init__(self):
-        self.target_spheres = []
+        self.target_spheres = {}  # id(target) -> live target, for O(1) hit removal
+        # Every target is parented here, so showing/hiding them all is one node toggle
+        self.targets_parent = Entity(name='targets')
+        self._alive = 0  # Live target count, kept in step with spawn/kill/clear
+        # Hidden target entities waiting to be reused; targets are never destroyed
+        self._free_targets = []
+        # (y cell, z cell) -> {id(target): (target, center)} for live targets
+        self._grid = {}
+        self._grid_cells = {}  # id(target) -> its grid cell
     
     def spawn_targets(self, count=10):
         """
@@ -28,49 +150,144 @@ class TargetManager:
         if not isinstance(count, int) or count <= 0 or count > 50:  # Prevent excessive spawning
             return
         
-        for _ in range(count):
+        free_targets = self._free_targets
+        for position in take_spawn_positions(count):
             try:
-                # Generate random positions within safe bounds
-                y = uniform(11, 20)
-                z = uniform(-10, 10)
-                
-                sphere = Entity(
-                    model='sphere',
-                    color=color.red,
-                    scale=1,
-                    position=(62, y, z),
-                    collider='box',
-                    name='target'
-                )
-                self.target_spheres.append(sphere)
+                if free_targets:
+                    # Reuse a hidden target: just move it and show it again
+                    sphere = free_targets.pop()
+                    sphere.position = position
+                    sphere.enabled = True
+                else:
+                    sphere = Entity(
+                        parent=self.targets_parent,
+                        model=get_target_model(),
+                        color=color.red,
+                        scale=1,
+                        position=position,
+                        name='target'
+                    )
+                    sphere.collider = get_target_collider(sphere)
+                self.target_spheres[id(sphere)] = sphere
+                self._grid_add(sphere, position)
+                self._alive += 1
                 
             except Exception as e:
                 print(f"Error spawning target: {e}")
                 continue
 
     def respawn_targets(self):
+        """Top the course back up to MIN_TARGET_COUNT live targets."""
+        if self._alive < MIN_TARGET_COUNT:
+            self.spawn_targets(count=MIN_TARGET_COUNT - self._alive)
+    
+    def kill_target(self, target):
         """
-        Maintain target count with safety checks.
+        Remove a hit target, hiding it for reuse by spawn_targets.
+        
+        Args:
+            target (Entity): The target entity that was hit
+        
+        Returns:
+            bool: True if the entity was a live target
         """
-        try:
-            # Clean up any None or destroyed targets
-            self.target_spheres[:] = [target for target in self.target_spheres if target and hasattr(target, 'enabled')]
-            
-            # Respawn if below minimum count
-            current_count = len(self.target_spheres)
-            if current_count < 10:
-                spawn_count = min(10 - current_count, 10)  # Cap spawn count
-                self.spawn_targets(count=spawn_count)
-                
-        except Exception as e:
-            print(f"Error in respawn_targets: {e}")
+        if self.target_spheres.pop(id(target), None) is None:
+            return False
+        
+        self._grid_remove(target)
+        self._alive -= 1
+        target.enabled = False
+        self._free_targets.append(target)
+        return True
     
     def clear_targets(self):
         """Clear all targets (used when ending game modes)."""
-        for target in self.target_spheres:
+        for target in self.target_spheres.values():
             if target:
-                destroy(target)
+                target.enabled = False
+                self._free_targets.append(target)
         self.target_spheres.clear()
+        self._grid.clear()
+        self._grid_cells.clear()
+        self._alive = 0
+
+    def _grid_add(self, target, position):
+        """Bucket a live target by its spawn position."""
+        cell = _grid_cell(position[1], position[2])
+        self._grid.setdefault(cell, {})[id(target)] = (target, position)
+        self._grid_cells[id(target)] = cell
+    
+    def _grid_remove(self, target):
+        """Drop a target from its grid bucket."""
+        cell = self._grid_cells.pop(id(target), None)
+        if cell is None:
+            return
+        bucket = self._grid[cell]
+        del bucket[id(target)]
+        if not bucket:
+            del self._grid[cell]
+    
+    def first_target_hit(self, origin, direction, max_distance):
+        """
+        Find the nearest live target box along a ray, without a scene raycast.
+        
+        Only grid cells the ray can reach while crossing the target wall are
+        tested. Occluding level geometry is not considered, so callers should
+        confirm a hit with a raycast bounded to the returned distance.
+        
+        Args:
+            origin (Vec3): Ray start
+            direction (Vec3): Unit ray direction
+            max_distance (float): Ray length
+        
+        Returns:
+            tuple: (target, distance), or (None, None) if no target is in the way
+        """
+        if not self._grid:
+            return None, None
+        
+        origin = (origin.x, origin.y, origin.z)
+        direction = (direction.x, direction.y, direction.z)
+        ox, oy, oz = origin
+        dx, dy, dz = direction
+        half = TARGET_HALF_SIZE
+        
+        # Candidate buckets: cells covering the stretch of ray inside the wall's x slab
+        buckets = self._grid.values()
+        if abs(dx) > 1e-9:
+            t0 = (TARGET_SPAWN_X - half - ox) / dx
+            t1 = (TARGET_SPAWN_X + half - ox) / dx
+            if t0 > t1:
+                t0, t1 = t1, t0
+            t0 = max(t0, 0.0)
+            t1 = min(t1, max_distance)
+            if t0 > t1:
+                return None, None
+            
+            y_a, y_b = oy + dy * t0, oy + dy * t1
+            z_a, z_b = oz + dz * t0, oz + dz * t1
+            cy_lo, cz_lo = _grid_cell(min(y_a, y_b) - half, min(z_a, z_b) - half)
+            cy_hi, cz_hi = _grid_cell(max(y_a, y_b) + half, max(z_a, z_b) + half)
+            
+            # A grazing ray can span more cells than there are buckets; scan buckets then
+            if (cy_hi - cy_lo + 1) * (cz_hi - cz_lo + 1) < len(self._grid):
+                get_bucket = self._grid.get
+                buckets = [bucket for bucket in
+                           (get_bucket((cy, cz))
+                            for cy in range(cy_lo, cy_hi + 1)
+                            for cz in range(cz_lo, cz_hi + 1))
+                           if bucket]
+        
+        best_target, best_distance = None, max_distance
+        for bucket in buckets:
+            for target, center in bucket.values():
+                entry = _ray_box_entry(origin, direction, center, half, best_distance)
+                if entry is not None and (best_target is None or entry < best_distance):
+                    best_target, best_distance = target, entry
+        
+        if best_target is None:
+            return None, None
+        return best_target, best_distance
 
 # Global target manager (will be initialized in main.py)
 target_manager = None
\ No newline at end of file
@@ -8,12 +8,96 @@ Advanced wall running mechanics with input requirements and physics.
 from ursina import *
 from config import *
 from utils import *
+from systems.physics_numeric import step_wall_run
 import math
 
 # ===============================================
 # === WALL RUNNING SYSTEM ===================
 # ===============================================
 
+# Debug flag bound once so the per-frame check is a plain global lookup
+_DEBUG = DEBUG_WALL_RUN
+
+# Resolved once: camera tilt is skipped entirely on cameras without rotation_z
+_CAMERA_HAS_ROTATION_Z = hasattr(camera, 'rotation_z')
+CAMERA_TILT_EPSILON = 0.01  # Degrees; closer than this counts as settled
+
+# Squared so the speed gate can skip the square root
+WALL_RUN_MIN_SPEED_SQ = WALL_RUN_MIN_SPEED * WALL_RUN_MIN_SPEED
+
+# Speeds and forces derived from the config values, folded once at import
+WALL_RUN_CLIMB_SPEED = WALL_RUN_SPEED * 0.3              # Vertical speed from looking up/down
+WALL_RUN_TANGENT_SPEED = WALL_RUN_SPEED * 0.5            # Speed with no clear look direction
+WALL_RUN_STICK_FORCE = 20.0                              # Inward pull keeping the player on the wall
+WALL_END_KICK_FORCE = WALL_RUN_SPEED * WALL_END_MOMENTUM_KICK
+WALL_END_UPWARD_FORCE = WALL_RUN_JUMP_FORCE * 0.3
+WALL_JUMP_HORIZONTAL_FORCE = WALL_RUN_JUMP_FORCE * 1.5
+WALL_JUMP_UPWARD_FORCE = WALL_RUN_JUMP_FORCE * 1.2
+
+# Heights above the player's feet where wall rays are cast
+WALL_CHECK_HEIGHTS = (0.5, 1.0, 1.5)
+WALL_DETECT_DISTANCE = 2.0
+
+# Ray origin buffer, refilled in place each check instead of allocating Vec3s
+_wall_ray_origins = [Vec3(0, 0, 0) for _ in WALL_CHECK_HEIGHTS]
+_MID_HEIGHT_OFFSET = Vec3(0, WALL_CHECK_HEIGHTS[1], 0)
+
+def fill_ray_origins(origins, position, heights):
+    """Write position + (0, height, 0) into each preallocated origin."""
+    x, y, z = position.x, position.y, position.z
+    for origin, height in zip(origins, heights):
+        origin.x = x
+        origin.y = y + height
+        origin.z = z
+    return origins
+
+# Batched wall rays (created on first use), one per check height. Detection
+# and the wall-still-there check never run in the same frame, so they share it.
+_wall_rays = None
+
+def get_wall_rays():
+    """Return the wall ray batch, creating it once."""
+    global _wall_rays
+    if _wall_rays is None:
+        _wall_rays = RayBatch(len(WALL_CHECK_HEIGHTS))
+    return _wall_rays
+
+# Reuse the cached wall plane while the player stays this close to the last raycast
+WALL_CACHE_MAX_MOVE = 0.25
+WALL_CHECK_DISTANCE = 3.0
+
+def clear_wall_cache(player_controller):
+    """Forget the cached wall plane (on wall run start/stop)."""
+    player_controller._wr_cached_plane_point = None
+    player_controller._wr_cached_plane_normal = None
+    player_controller._wr_last_check_pos = None
+
+def cached_wall_still_there(player_controller, position, direction):
+    """
+    Test the mid-height ray against the cached wall plane instead of the scene.
+    
+    Args:
+        player_controller: The player controller
+        position (Vec3): Player position already read this frame
+        direction (Vec3): Direction toward the wall
+    
+    Returns:
+        bool: True if the cached plane is still within reach along the ray
+    """
+    plane_normal = player_controller._wr_cached_plane_normal
+    if plane_normal is None:
+        return False
+    if (position - player_controller._wr_last_check_pos).length() >= WALL_CACHE_MAX_MOVE:
+        return False
+    
+    denominator = direction.dot(plane_normal)
+    if abs(denominator) < 1e-6:
+        return False  # Ray parallel to the wall
+    
+    origin = position + _MID_HEIGHT_OFFSET
+    t = (player_controller._wr_cached_plane_point - origin).dot(plane_normal) / denominator
+    return 0 < t < WALL_CHECK_DISTANCE
+
 def check_wall_running_input(wall_run_side):
     """
     Check if player is holding the correct keys for wall running.
@@ -36,146 +120,96 @@ def check_wall_running_input(wall_run_side):
 def detect_wall_for_running(player_controller):
     """
     Detect if player can start wall running on nearby walls.
-    Must be holding W + A (left wall) or W + D (right wall).
+    Must be holding W + A (left wall) or W + D (right wall); the caller
+    checks W and grounded before calling.
     Returns wall normal and side (-1 left, 1 right, 0 none).
     """
     if not player_controller.player or player_controller.is_sliding:
         return None, 0
     
-    # Must be holding forward key to start wall running
-    if not held_keys['w']:
+    # Need a strafe key toward some wall before any vector math or raycasts
+    right_wanted = held_keys['d']
+    left_wanted = held_keys['a']
+    if not (right_wanted or left_wanted):
         return None, 0
     
-    # Check horizontal speed requirement
-    horizontal_speed = math.sqrt(player_controller.movement_velocity.x**2 + player_controller.movement_velocity.z**2)
-    if horizontal_speed < WALL_RUN_MIN_SPEED:
+    # Check horizontal speed requirement (squared, no sqrt needed)
+    vx = player_controller.movement_velocity.x
+    vz = player_controller.movement_velocity.z
+    move_len_sq = vx * vx + vz * vz
+    if move_len_sq < WALL_RUN_MIN_SPEED_SQ:
         return None, 0
     
-    # Check walls on left and right sides with multiple rays for better detection
+    # Movement along the camera's right vector (negated for the left wall)
     player_right = camera.right.normalized()
+    inv_len = 1.0 / math.sqrt(move_len_sq) if move_len_sq > 1e-12 else 0.0
+    right_dot = (vx * player_right.x + vz * player_right.z) * inv_len
     
-    # Check right wall with multiple height points
-    right_hits = []
-    for height_offset in [0.5, 1.0, 1.5]:
-        right_hit = raycast(
-            origin=player_controller.player.position + Vec3(0, height_offset, 0),
-            direction=player_right,
-            distance=2.0,
-            ignore=[player_controller.player, player_controller.player_model]
-        )
-        if right_hit and right_hit.hit:
-            right_hits.append(right_hit)
-    
-    # Check left wall with multiple height points
-    left_hits = []
-    for height_offset in [0.5, 1.0, 1.5]:
-        left_hit = raycast(
-            origin=player_controller.player.position + Vec3(0, height_offset, 0),
-            direction=-player_right,
-            distance=2.0,
-            ignore=[player_controller.player, player_controller.player_model]
-        )
-        if left_hit and left_hit.hit:
-            left_hits.append(left_hit)
-    
-    # Determine which wall to use
-    movement_dir = Vec3(player_controller.movement_velocity.x, 0, player_controller.movement_velocity.z)
-    if movement_dir.length() > 0:
-        movement_dir = movement_dir.normalized()
-    
-    # Check right wall (must be holding W + D)
-    if right_hits and held_keys['d']:
-        right_hit = right_hits[0]
-        if abs(right_hit.normal.y) < 0.5:
-            dot_product = movement_dir.dot(player_right) if movement_dir.length() > 0 else 0
-            if dot_product > 0.1:
-                return right_hit.normal, 1
+    # Only one side can pass: W + D moving right, or W + A moving left
+    if right_wanted and right_dot > 0.1:
+        side, check_direction = 1, player_right
+    elif left_wanted and -right_dot > 0.1:
+        side, check_direction = -1, -player_right
+    else:
+        return None, 0
     
-    # Check left wall (must be holding W + A)
-    if left_hits and held_keys['a']:
-        left_hit = left_hits[0]
-        if abs(left_hit.normal.y) < 0.5:
-            dot_product = movement_dir.dot(-player_right) if movement_dir.length() > 0 else 0
-            if dot_product > 0.1:
-                return left_hit.normal, -1
+    # Cast that side's rays at every height in one traversal; first hit in height order wins
+    hits = get_wall_rays().cast(
+        origins=fill_ray_origins(_wall_ray_origins, player_controller.player.position, WALL_CHECK_HEIGHTS),
+        direction=check_direction,
+        distance=WALL_DETECT_DISTANCE,
+        ignore=player_controller._collision_ignore
+    )
+    for hit in hits:
+        if hit:
+            if abs(hit.normal.y) < 0.5:
+                return hit.normal, side
+            break
     
     return None, 0
 
-def apply_wall_running_physics(player_controller):
+def apply_wall_running_physics(player_controller, forward_dir=None):
     """
     Apply physics while wall running - continues automatically once started.
+    
+    Args:
+        player_controller: The player controller
+        forward_dir (Vec3): Normalized camera forward already read this frame
     """
     # Wall running now continues until wall ends or player jumps
+    # (Ursina's physics was disabled once when the wall run started)
     
-    # Completely disable Ursina's built-in physics during wall running
-    disable_ursina_physics(player_controller)
+    dt = time.dt
     
     # COMPLETELY eliminate slipping - override ALL vertical movement
-    # Disable Ursina's built-in gravity during wall running
-    player_controller.player.velocity_y = 0
     player_controller.movement_velocity.y = 0
     
-    # Force zero vertical velocity in the Ursina controller
-    if hasattr(player_controller.player, 'velocity'):
-        player_controller.player.velocity = Vec3(player_controller.player.velocity.x, 0, player_controller.player.velocity.z)
-    
-    # Optional: Allow slight vertical movement based on look direction
-    forward_dir = camera.forward.normalized()
-    vertical_control = 0
-    if forward_dir.y > 0.1:  # Looking up
-        vertical_control = forward_dir.y * WALL_RUN_SPEED * 0.3
-    elif forward_dir.y < -0.1:  # Looking down
-        vertical_control = forward_dir.y * WALL_RUN_SPEED * 0.3
+    # Run along the wall, stick to it, and climb/descend with the look direction
+    if forward_dir is None:
+        forward_dir = camera.forward.normalized()
+    wall_normal = player_controller.wall_normal
+    velocity_x, velocity_z, climb_step = step_wall_run(
+        forward_dir.x, forward_dir.y, forward_dir.z,
+        wall_normal.x, wall_normal.y, wall_normal.z,
+        dt, WALL_RUN_SPEED, WALL_RUN_TANGENT_SPEED, WALL_RUN_CLIMB_SPEED, WALL_RUN_STICK_FORCE
+    )
     
     # Apply vertical control directly to position instead of velocity
-    if abs(vertical_control) > 0.01:
-        player_controller.player.position += Vec3(0, vertical_control * time.dt, 0)
-    
-    # Calculate movement along the wall with consistent horizontal speed
-    # Get horizontal component of look direction (ignore Y)
-    horizontal_forward = Vec3(forward_dir.x, 0, forward_dir.z)
-    
-    if horizontal_forward.length() > 0:
-        horizontal_forward = horizontal_forward.normalized()
-        
-        # Project horizontal direction onto wall surface for full horizontal speed
-        wall_horizontal = horizontal_forward - player_controller.wall_normal * horizontal_forward.dot(player_controller.wall_normal)
-        
-        if wall_horizontal.length() > 0:
-            wall_horizontal = wall_horizontal.normalized()
-            # Apply full speed horizontally
-            horizontal_velocity = wall_horizontal * WALL_RUN_SPEED
-        else:
-            horizontal_velocity = Vec3(0, 0, 0)
-    else:
-        # If looking straight up/down, maintain current direction or use wall tangent
-        # Use the wall's tangent direction (perpendicular to wall normal)
-        wall_right = Vec3(-player_controller.wall_normal.z, 0, player_controller.wall_normal.x).normalized()
-        horizontal_velocity = wall_right * WALL_RUN_SPEED * 0.5  # Reduced speed when no clear direction
+    if climb_step != 0.0:
+        player_controller.player.y += climb_step
     
     # DIRECTLY set horizontal velocity (no lerping - immediate response)
-    player_controller.movement_velocity.x = horizontal_velocity.x
-    player_controller.movement_velocity.z = horizontal_velocity.z
-    
-    # Extremely strong inward force to stick to wall
-    stick_force = player_controller.wall_normal * -20.0 * time.dt
-    player_controller.movement_velocity.x += stick_force.x
-    player_controller.movement_velocity.z += stick_force.z
-    
-    # Apply movement directly to player position, bypassing Ursina's physics
-    movement_step = Vec3(
-        player_controller.movement_velocity.x * time.dt,
-        0,  # Force zero vertical movement
-        player_controller.movement_velocity.z * time.dt
-    )
-    player_controller.player.position += movement_step
+    player_controller.movement_velocity.x = velocity_x
+    player_controller.movement_velocity.z = velocity_z
     
-    # Ensure Ursina's controller doesn't interfere
-    player_controller.player.velocity_y = 0
-    if hasattr(player_controller.player, 'velocity'):
-        player_controller.player.velocity = Vec3(0, 0, 0)
+    # Apply movement directly to player position, bypassing Ursina's physics.
+    # position returns a copy, so write x/z through their own setters (y stays put)
+    player = player_controller.player
+    player.x += velocity_x * dt
+    player.z += velocity_z * dt
     
-    print(f"Wall running - No slip mode - Y vel: {player_controller.movement_velocity.y:.2f}, Speed: {math.sqrt(player_controller.movement_velocity.x**2 + player_controller.movement_velocity.z**2):.2f}")
+    if _DEBUG:
+        print(f"Wall running - No slip mode - Y vel: {player_controller.movement_velocity.y:.2f}, Speed: {math.hypot(player_controller.movement_velocity.x, player_controller.movement_velocity.z):.2f}")
 
 def disable_ursina_physics(player_controller):
     """Completely disable Ursina's built-in physics during wall running."""
@@ -212,20 +246,39 @@ def restore_ursina_physics(player_controller):
 def handle_wall_running(player_controller):
     """Handle wall running detection and state management."""
     if not player_controller.is_wall_running:
+        # Wall runs only start in the air while holding forward
+        if player_controller.player.grounded or not held_keys['w']:
+            player_controller._wr_detect_counter = 0
+            return
+        
+        # Look for a wall every WALL_RUN_DETECT_INTERVAL frames (first check is immediate)
+        player_controller._wr_detect_counter += 1
+        if (player_controller._wr_detect_counter - 1) % WALL_RUN_DETECT_INTERVAL != 0:
+            return
+        
         # Try to start wall running
         detected_normal, detected_side = detect_wall_for_running(player_controller)
         
-        if detected_normal and detected_side != 0 and not player_controller.player.grounded:
+        if detected_normal and detected_side != 0:
             player_controller.is_wall_running = True
             player_controller.wall_normal = detected_normal
             player_controller.wall_run_side = detected_side
             player_controller.wall_run_timer = 0.0
-            print(f"Started wall running on {'right' if detected_side == 1 else 'left'} wall - Press SPACE to jump off - Speed: {math.sqrt(player_controller.movement_velocity.x**2 + player_controller.movement_velocity.z**2):.1f}")
+            clear_wall_cache(player_controller)
+            
+            # Disable Ursina's built-in physics for the whole wall run
+            disable_ursina_physics(player_controller)
+            if _DEBUG:
+                print(f"Started wall running on {'right' if detected_side == 1 else 'left'} wall - Press SPACE to jump off - Speed: {math.hypot(player_controller.movement_velocity.x, player_controller.movement_velocity.z):.1f}")
     
     else:
         # Continue wall running
         player_controller.wall_run_timer += time.dt
         
+        # Read the camera vectors once for every check below
+        cam_right = camera.right
+        forward_dir = camera.forward.normalized()
+        
         # Check if we should stop wall running
         should_stop = False
         
@@ -234,52 +287,65 @@ def handle_wall_running(player_controller):
         # 2. Player presses space to jump
         
         # Check if wall still exists
-        check_direction = camera.right if player_controller.wall_run_side == 1 else -camera.right
+        check_direction = cam_right if player_controller.wall_run_side == 1 else -cam_right
         wall_still_there = False
         
-        # Check multiple points to detect wall end
-        for height_offset in [0.5, 1.0, 1.5]:
-            for distance in [2.5, 3.0]:
-                wall_check = raycast(
-                    origin=player_controller.player.position + Vec3(0, height_offset, 0),
-                    direction=check_direction,
-                    distance=distance,
-                    ignore=[player_controller.player, player_controller.player_model]
-                )
-                if wall_check and wall_check.hit:
+        # Steady state: the wall plane from the last raycast is still beside us
+        position = player_controller.player.position
+        wall_still_there = cached_wall_still_there(
+            player_controller, position, check_direction
+        )
+        
+        # Otherwise check multiple heights to detect wall end (first hit in height order wins)
+        if not wall_still_there:
+            for wall_check in get_wall_rays().cast(
+                origins=fill_ray_origins(_wall_ray_origins, position, WALL_CHECK_HEIGHTS),
+                direction=check_direction,
+                distance=WALL_CHECK_DISTANCE,
+                ignore=player_controller._collision_ignore
+            ):
+                if wall_check:
                     # Update wall normal for better tracking
                     player_controller.wall_normal = wall_check.normal
+                    player_controller._wr_cached_plane_point = wall_check.world_point
+                    player_controller._wr_cached_plane_normal = wall_check.world_normal
+                    player_controller._wr_last_check_pos = position  # position getter already returns a copy
                     wall_still_there = True
                     break
-            if wall_still_there:
-                break
         
         # Stop condition 1: Wall ends - apply momentum kick
         if not wall_still_there:
-            # Calculate wall running direction for momentum kick
-            forward_dir = camera.forward.normalized()
-            horizontal_forward = Vec3(forward_dir.x, 0, forward_dir.z)
+            # Calculate wall running direction for momentum kick (scalar math)
+            wall_normal = player_controller.wall_normal
+            look_x, look_z = forward_dir.x, forward_dir.z
+            look_len_sq = look_x * look_x + look_z * look_z
             
-            if horizontal_forward.length() > 0:
-                horizontal_forward = horizontal_forward.normalized()
+            if look_len_sq > 1e-12:
+                inv_len = 1.0 / math.sqrt(look_len_sq)
+                look_x *= inv_len
+                look_z *= inv_len
+                
                 # Project direction along wall surface
-                wall_direction = horizontal_forward - player_controller.wall_normal * horizontal_forward.dot(player_controller.wall_normal)
+                along_normal = look_x * wall_normal.x + look_z * wall_normal.z
+                wall_x = look_x - wall_normal.x * along_normal
+                wall_y = -wall_normal.y * along_normal
+                wall_z = look_z - wall_normal.z * along_normal
+                wall_len_sq = wall_x * wall_x + wall_y * wall_y + wall_z * wall_z
                 
-                if wall_direction.length() > 0:
-                    wall_direction = wall_direction.normalized()
-                    
+                if wall_len_sq > 1e-12:
                     # Apply momentum kick in wall running direction
-                    kick_force = WALL_RUN_SPEED * WALL_END_MOMENTUM_KICK
-                    player_controller.movement_velocity.x = wall_direction.x * kick_force
-                    player_controller.movement_velocity.z = wall_direction.z * kick_force
+                    kick_scale = WALL_END_KICK_FORCE / math.sqrt(wall_len_sq)
+                    player_controller.movement_velocity.x = wall_x * kick_scale
+                    player_controller.movement_velocity.z = wall_z * kick_scale
                     
                     # Small upward component to help with transitions
-                    player_controller.movement_velocity.y = WALL_RUN_JUMP_FORCE * 0.3
+                    player_controller.movement_velocity.y = WALL_END_UPWARD_FORCE
                     
-                    print(f"Wall ended - momentum kick applied! Direction: {wall_direction}, Force: {kick_force:.1f}")
-                else:
+                    if _DEBUG:
+                        print(f"Wall ended - momentum kick applied! Direction: ({wall_x:.2f}, {wall_y:.2f}, {wall_z:.2f}), Force: {WALL_END_KICK_FORCE:.1f}")
+                elif _DEBUG:
                     print("Wall running stopped - wall ended (no momentum)")
-            else:
+            elif _DEBUG:
                 print("Wall running stopped - wall ended (no direction)")
             
             should_stop = True
@@ -290,42 +356,46 @@ def handle_wall_running(player_controller):
             jump_direction = player_controller.wall_normal.normalized()
             
             # Strong horizontal kick away from wall
-            kick_force = WALL_RUN_JUMP_FORCE * 1.5
+            kick_force = WALL_JUMP_HORIZONTAL_FORCE
             player_controller.movement_velocity.x = jump_direction.x * kick_force
             player_controller.movement_velocity.z = jump_direction.z * kick_force
             
             # Strong upward component
-            player_controller.movement_velocity.y = WALL_RUN_JUMP_FORCE * 1.2
+            player_controller.movement_velocity.y = WALL_JUMP_UPWARD_FORCE
             
             should_stop = True
-            print(f"Wall jump! Kicked away from {'right' if player_controller.wall_run_side == 1 else 'left'} wall with force {kick_force:.1f}")
+            if _DEBUG:
+                print(f"Wall jump! Kicked away from {'right' if player_controller.wall_run_side == 1 else 'left'} wall with force {kick_force:.1f}")
         
         if should_stop:
             player_controller.is_wall_running = False
             player_controller.wall_run_timer = 0.0
             player_controller.wall_run_side = 0
+            clear_wall_cache(player_controller)
             
             # Restore normal physics when wall running ends
             restore_ursina_physics(player_controller)
-            print("Stopped wall running")
+            if _DEBUG:
+                print("Stopped wall running")
         else:
             # Apply wall running physics
-            apply_wall_running_physics(player_controller)
+            apply_wall_running_physics(player_controller, forward_dir)
 
 def update_wall_running_camera(player_controller):
     """Apply camera effects during wall running."""
+    if not _CAMERA_HAS_ROTATION_Z:
+        return
+    
+    # Tilt camera based on wall side while wall running, back to level otherwise
     if player_controller.is_wall_running:
-        # Tilt camera based on wall side
         target_tilt = WALL_RUN_CAMERA_TILT * player_controller.wall_run_side
-        try:
-            if hasattr(camera, 'rotation_z'):
-                camera.rotation_z = lerp(camera.rotation_z, target_tilt, time.dt * 5)
-        except:
-            pass
+        rate = 5
     else:
-        # Return camera to normal
-        try:
-            if hasattr(camera, 'rotation_z'):
-                camera.rotation_z = lerp(camera.rotation_z, 0, time.dt * 8)
-        except:
-            pass
\ No newline at end of file
+        target_tilt = 0
+        rate = 8
+    
+    # Skip the node write once the tilt has settled
+    current_tilt = camera.rotation_z
+    if abs(current_tilt - target_tilt) < CAMERA_TILT_EPSILON:
+        return
+    camera.rotation_z = lerp(current_tilt, target_tilt, time.dt * rate)
@@ -7,11 +7,15 @@ Game modes, UI, and state management.
 
 from ursina import *
 from config import *
+from core.system_refs import get_system, set_game_elements_enabled, PLAYER_ELEMENTS
 
 # ===============================================
 # === GAME STATE MANAGEMENT ====================
 # ===============================================
 
+# Timed mode countdown step (seconds); the timer only shows whole seconds
+TIMER_TICK_INTERVAL = 0.1
+
 class GameState:
     def __init__(self):
         # Timed mode state
@@ -20,7 +24,10 @@ class GameState:
         self.score = 0
         self.shots_fired = 0
         self.hits = 0
-        self.results_screen = None
+        self._last_displayed_time = -1  # Whole seconds last written to timer_text
+        self._last_accuracy_pct = 0     # Accuracy percentage last written to accuracy_text
+        self._timer_accumulator = 0.0   # Frame time not yet consumed by timer ticks
+        self._timer_ticks_left = round(TIMER_DURATION / TIMER_TICK_INTERVAL)  # Whole ticks until time is up
         
         # UI Elements
         self.timer_text = Text(
@@ -47,45 +54,32 @@ class GameState:
             background=True,
             enabled=ACCURACY_TRACKING
         )
+        self._hud = (self.timer_text, self.score_text, self.accuracy_text)
+        # Last string written to each HUD text, so unchanged values skip the mesh rebuild
+        self._hud_strings = {id(hud_text): hud_text.text for hud_text in self._hud}
+        
+        # Results screen, created once and re-filled at the end of each round
+        self.results_screen = Text(
+            "",
+            origin=(0, 0),
+            scale=2,
+            color=color.yellow,
+            enabled=False
+        )
     
     def start_timed_mode(self, target_manager):
         """Start timed mode with UI and targets."""
         # Hide menu
-        try:
-            import src.ui.menu as menu
-            if hasattr(menu, 'menu_system') and menu.menu_system:
-                menu.menu_system.hide_menu()
-        except (ImportError, AttributeError):
-            pass
+        menu_system = get_system('menu_system')
+        if menu_system:
+            menu_system.hide_menu()
         
-        # Show game elements
-        try:
-            import src.systems.map_environment as me
-            if hasattr(me, 'map_environment') and me.map_environment:
-                me.map_environment.show_game()
-        except (ImportError, AttributeError):
-            pass
-        
-        # Enable player and weapon
-        try:
-            import src.core.player as player
-            if hasattr(player, 'player_controller') and player.player_controller:
-                player.player_controller.player.enabled = True
-        except (ImportError, AttributeError):
-            pass
-        
-        try:
-            import src.core.weapons as weapons
-            if hasattr(weapons, 'weapon_controller') and weapons.weapon_controller:
-                weapons.weapon_controller.gun_model.enabled = True
-                weapons.weapon_controller.gun_equipped = True
-        except (ImportError, AttributeError):
-            pass
+        # Show game elements, player and weapon
+        set_game_elements_enabled(True)
         
         # Show HUD
-        self.timer_text.enabled = True
-        self.score_text.enabled = True
-        self.accuracy_text.enabled = True
+        for hud_text in self._hud:
+            hud_text.enabled = True
 
         # Setup state
         target_manager.spawn_targets()
@@ -93,39 +87,30 @@ class GameState:
         mouse.locked = True
         self.is_timed_mode = True
         self.time_remaining = TIMER_DURATION
+        self._timer_accumulator = 0.0
+        self._timer_ticks_left = round(TIMER_DURATION / TIMER_TICK_INTERVAL)
         self.score = 0
         self.shots_fired = 0
         self.hits = 0
-        self.score_text.text = f"Score: {self.score}"
+        # The timer text only changes on ticks, so show the full duration right away
+        self._last_displayed_time = int(TIMER_DURATION)
+        self._set_hud_text(self.timer_text, f"Time: {int(TIMER_DURATION)}")
+        self._set_hud_text(self.score_text, f"Score: {self.score}")
+        self._last_accuracy_pct = 0
         if ACCURACY_TRACKING:
-            self.accuracy_text.text = "Accuracy: 0%"
+            self._set_hud_text(self.accuracy_text, "Accuracy: 0%")
 
-        if self.results_screen:
-            destroy(self.results_screen)
+        self.results_screen.enabled = False
     
     def end_timed_mode(self, target_manager):
         """End timed mode and show results."""
         self.is_timed_mode = False
 
         # Hide HUD + game elements
-        self.timer_text.enabled = False
-        self.score_text.enabled = False
-        self.accuracy_text.enabled = False
-        
-        try:
-            import src.core.player as player
-            if hasattr(player, 'player_controller') and player.player_controller:
-                player.player_controller.player.enabled = False
-        except (ImportError, AttributeError):
-            pass
+        for hud_text in self._hud:
+            hud_text.enabled = False
         
-        try:
-            import src.core.weapons as weapons
-            if hasattr(weapons, 'weapon_controller') and weapons.weapon_controller:
-                weapons.weapon_controller.gun_model.enabled = False
-                weapons.weapon_controller.gun_equipped = False
-        except (ImportError, AttributeError):
-            pass
+        set_game_elements_enabled(False, PLAYER_ELEMENTS)
         
         if target_manager:
             target_manager.clear_targets()
@@ -136,36 +121,83 @@ class GameState:
         # Calculate accuracy
         accuracy = (self.hits / self.shots_fired * 100) if self.shots_fired > 0 else 0
 
-        # Results screen
-        self.results_screen = Text(
-            f"⏱ Time's up!\nScore: {self.score}\nAccuracy: {accuracy:.1f}%\n\nPress ENTER to return to Menu",
-            origin=(0, 0),
-            scale=2,
-            background=True,
-            color=color.yellow
-        )
+        # Results screen (background is rebuilt to fit the new text)
+        self.results_screen.text = f"⏱ Time's up!\nScore: {self.score}\nAccuracy: {accuracy:.1f}%\n\nPress ENTER to return to Menu"
+        self.results_screen.background = True
+        self.results_screen.enabled = True
+    
+    def _set_hud_text(self, hud_text, text):
+        """Write a HUD string only if it differs from what the text already shows."""
+        key = id(hud_text)
+        if self._hud_strings.get(key) != text:
+            self._hud_strings[key] = text
+            hud_text.text = text
+    
+    def on_shot(self, hit):
+        """
+        Count a fired shot and refresh the accuracy display if the shown value changed.
+        
+        Args:
+            hit (bool): Whether the shot destroyed a target
+        """
+        self.shots_fired += 1
+        if not self.is_timed_mode:
+            return
+        
+        if hit:
+            self.hits += 1
+        
+        if not ACCURACY_TRACKING:
+            return
+        
+        # Whole-percent accuracy with integer math; text only rebuilt on change
+        accuracy_pct = (self.hits * 100) // self.shots_fired
+        if accuracy_pct != self._last_accuracy_pct:
+            self._last_accuracy_pct = accuracy_pct
+            self._set_hud_text(self.accuracy_text, f"Accuracy: {accuracy_pct}%")
+    
+    def add_score(self, points):
+        """
+        Add points to the score, rebuilding the score text only if the score changed.
+        
+        Args:
+            points (int): Points awarded for a hit
+        """
+        if not points:
+            return
+        
+        self.score += points
+        self._set_hud_text(self.score_text, f"Score: {self.score}")
     
     def update_timed_mode(self, target_manager):
-        """Update timed mode countdown and UI."""
-        if self.is_timed_mode:
-            self.time_remaining -= time.dt
-            self.timer_text.text = f"Time: {int(self.time_remaining)}"
-            if self.time_remaining <= 0:
+        """Update timed mode countdown and UI on a fixed TIMER_TICK_INTERVAL step."""
+        if not self.is_timed_mode:
+            return
+        
+        self._timer_accumulator += time.dt
+        while self._timer_accumulator >= TIMER_TICK_INTERVAL:
+            self._timer_accumulator -= TIMER_TICK_INTERVAL
+            self._timer_ticks_left -= 1
+            self.time_remaining = self._timer_ticks_left * TIMER_TICK_INTERVAL
+            
+            # Only rebuild the timer text when the displayed second changes
+            seconds = int(self.time_remaining)
+            if seconds != self._last_displayed_time:
+                self._last_displayed_time = seconds
+                self._set_hud_text(self.timer_text, f"Time: {seconds}")
+            
+            if self._timer_ticks_left <= 0:
                 self.end_timed_mode(target_manager)
+                break
     
     def return_to_menu(self, player_controller):
         """Return to main menu."""
-        if self.results_screen:
-            destroy(self.results_screen)
-            self.results_screen = None
+        self.results_screen.enabled = False
 
         # Show menu again
-        try:
-            import src.ui.menu as menu
-            if hasattr(menu, 'menu_system') and menu.menu_system:
-                menu.menu_system.show_menu()
-        except (ImportError, AttributeError):
-            pass
+        menu_system = get_system('menu_system')
+        if menu_system:
+            menu_system.show_menu()
         
         # Reset player
         if player_controller:
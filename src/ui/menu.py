@@ -7,6 +7,7 @@ Main menu, UI, and navigation.
 
 from ursina import *
 from config import *
+from core.system_refs import get_system, set_game_elements_enabled
 
 # ===============================================
 # === MENU SYSTEM ===============================
@@ -74,28 +75,7 @@ class MenuSystem:
     
     def hide_game_elements(self):
         """Hide all game elements."""
-        # Use global references instead of imports since they're already set up
-        try:
-            import src.systems.map_environment as me
-            if hasattr(me, 'map_environment') and me.map_environment:
-                me.map_environment.hide_game()
-        except (ImportError, AttributeError):
-            pass
-        
-        try:
-            import src.core.player as player
-            if hasattr(player, 'player_controller') and player.player_controller:
-                player.player_controller.player.enabled = False
-        except (ImportError, AttributeError):
-            pass
-        
-        try:
-            import src.core.weapons as weapons
-            if hasattr(weapons, 'weapon_controller') and weapons.weapon_controller:
-                weapons.weapon_controller.gun_model.enabled = False
-                weapons.weapon_controller.gun_equipped = False
-        except (ImportError, AttributeError):
-            pass
+        set_game_elements_enabled(False)
     
     def show_menu(self):
         """Show the main menu."""
@@ -116,48 +96,21 @@ class MenuSystem:
         """Start casual play mode."""
         self.hide_menu()
         
-        try:
-            import src.systems.map_environment as me
-            if hasattr(me, 'map_environment') and me.map_environment:
-                me.map_environment.show_game()
-        except (ImportError, AttributeError):
-            pass
-        
-        try:
-            import src.core.player as player
-            if hasattr(player, 'player_controller') and player.player_controller:
-                player.player_controller.player.enabled = True
-        except (ImportError, AttributeError):
-            pass
-        
-        try:
-            import src.core.weapons as weapons
-            if hasattr(weapons, 'weapon_controller') and weapons.weapon_controller:
-                weapons.weapon_controller.gun_model.enabled = True
-                weapons.weapon_controller.gun_equipped = True
-        except (ImportError, AttributeError):
-            pass
+        set_game_elements_enabled(True)
         
-        try:
-            import src.systems.targets as targets
-            if hasattr(targets, 'target_manager') and targets.target_manager:
-                targets.target_manager.spawn_targets()
-        except (ImportError, AttributeError):
-            pass
+        target_manager = get_system('target_manager')
+        if target_manager:
+            target_manager.spawn_targets()
         
         camera.fov = FOV_DEFAULT
         mouse.locked = True
     
     def start_timed_mode(self):
         """Start timed mode."""
-        try:
-            import src.ui.game_state as gs
-            import src.systems.targets as targets
-            if (hasattr(gs, 'game_state') and gs.game_state and 
-                hasattr(targets, 'target_manager') and targets.target_manager):
-                gs.game_state.start_timed_mode(targets.target_manager)
-        except (ImportError, AttributeError):
-            pass
+        game_state = get_system('game_state')
+        target_manager = get_system('target_manager')
+        if game_state and target_manager:
+            game_state.start_timed_mode(target_manager)
 
 # Global menu system (will be initialized in main.py)
 menu_system = None
\ No newline at end of file
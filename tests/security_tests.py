@@ -6,9 +6,12 @@ Security Test Suite
 Comprehensive security tests for the game configuration system.
 """
 
+import io
+import sys
 import unittest
 import tempfile
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from security_config import SecurityConfig, SecurityLogger, RateLimiter
 
@@ -203,28 +206,36 @@ def run_security_tests():
     print("🔒 Running Security Test Suite...")
     print("=" * 50)
     
-    # Create test suite
+    # Each TestCase class is independent, so run them concurrently with
+    # per-class output buffers that are printed in order afterwards
     loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
+    test_cases = [TestSecurityConfig, TestRateLimiter, TestSecurityIntegration]
     
-    # Add test cases
-    suite.addTests(loader.loadTestsFromTestCase(TestSecurityConfig))
-    suite.addTests(loader.loadTestsFromTestCase(TestRateLimiter))
-    suite.addTests(loader.loadTestsFromTestCase(TestSecurityIntegration))
+    def run_test_case(test_case):
+        stream = io.StringIO()
+        runner = unittest.TextTestRunner(stream=stream, verbosity=2)
+        return runner.run(loader.loadTestsFromTestCase(test_case)), stream.getvalue()
     
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+        outcomes = list(executor.map(run_test_case, test_cases))
+    
+    failures = []
+    errors = []
+    for result, output in outcomes:
+        sys.stderr.write(output)
+        failures.extend(result.failures)
+        errors.extend(result.errors)
+    success = all(result.wasSuccessful() for result, _ in outcomes)
     
     # Print summary
     print("\n" + "=" * 50)
-    if result.wasSuccessful():
+    if success:
         print("✅ All security tests passed!")
     else:
-        print(f"❌ {len(result.failures)} test(s) failed")
-        print(f"❌ {len(result.errors)} error(s) occurred")
+        print(f"❌ {len(failures)} test(s) failed")
+        print(f"❌ {len(errors)} error(s) occurred")
     
-    return result.wasSuccessful()
+    return success
 
 if __name__ == "__main__":
     success = run_security_tests()
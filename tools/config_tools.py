@@ -11,6 +11,53 @@ import sys
 import subprocess
 from pathlib import Path
 
+# ANSI clear screen + cursor home; avoids spawning a shell per redraw
+_CLEAR_SEQ = '\033[2J\033[H'
+_VT_AVAILABLE = sys.stdout.isatty()
+_vt_checked = False
+
+def _enable_vt():
+    """Turn on VT escape processing once, on the first clear (Windows 10+ consoles need it)."""
+    global _VT_AVAILABLE, _vt_checked
+    _vt_checked = True
+    if os.name != 'nt':
+        return
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        # 0x0004 = ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        if not (kernel32.GetConsoleMode(handle, ctypes.byref(mode)) and
+                kernel32.SetConsoleMode(handle, mode.value | 0x0004)):
+            _VT_AVAILABLE = False
+    except (AttributeError, OSError):
+        _VT_AVAILABLE = False
+
+# Shared project-directory helpers live with the other security rules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'security'))
+from security_config import get_cwd, is_inside_cwd, register_cwd_cache
+
+# Snapshot of file names in the project directory (one scandir per refresh)
+_files = None
+
+def scan_files():
+    """Read the project directory once into a set of file names."""
+    global _files
+    try:
+        with os.scandir(get_cwd()) as entries:
+            _files = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        _files = set()
+    return _files
+
+def _reset_files():
+    """Drop the file snapshot so the next menu draw rescans the new directory."""
+    global _files
+    _files = None
+
+register_cwd_cache(_reset_files)
+
 class Colors:
     RED = '\033[31m'
     GREEN = '\033[32m'
@@ -31,6 +78,16 @@ class Colors:
 
 def clear_screen():
     """Clear the terminal screen safely."""
+    if _VT_AVAILABLE and not _vt_checked:
+        _enable_vt()
+    if _VT_AVAILABLE:
+        try:
+            sys.stdout.write(_CLEAR_SEQ)
+            sys.stdout.flush()
+            return
+        except OSError:
+            pass
+    
     try:
         if os.name == 'nt':
             subprocess.run(['cls'], shell=True, check=False, timeout=5)
@@ -40,56 +97,75 @@ def clear_screen():
         # Fallback: print newlines
         print('\n' * 50)
 
-def print_header():
-    """Print the application header."""
-    header = """
+HEADER = """
 ╔══════════════════════════════════════════════════════════════╗
 ║                🛠️  GAME CONFIGURATION TOOLS 🛠️                 ║
 ║                 Choose your configuration tool               ║
 ╚══════════════════════════════════════════════════════════════╝
     """
-    print(Colors.colorize(header, Colors.BRIGHT_CYAN))
+HEADER_COLORED = Colors.colorize(HEADER, Colors.BRIGHT_CYAN)
 
-def print_menu():
-    """Print the main menu."""
-    print(Colors.colorize("🔧 Available Tools:", Colors.BRIGHT_WHITE))
-    print()
-    
-    tools = [
-        ("Interactive Settings Editor", "settings_editor.py", "Edit all game settings with a user-friendly interface"),
-        ("Configuration Validator", "config_validator.py", "Validate settings and show configuration summary"),
-        ("Settings Examples & Presets", "settings_examples.py", "View and apply preset configurations"),
-        ("Start Game", "main.py", "Launch the game with current settings"),
-    ]
+# (name, script, description) for each launchable tool
+TOOLS = [
+    ("Interactive Settings Editor", "settings_editor.py", "Edit all game settings with a user-friendly interface"),
+    ("Configuration Validator", "config_validator.py", "Validate settings and show configuration summary"),
+    ("Settings Examples & Presets", "settings_examples.py", "View and apply preset configurations"),
+    ("Start Game", "main.py", "Launch the game with current settings"),
+]
+
+# Fully colorized menu text, built on first draw and on refresh
+_menu_text = None
+
+def print_header():
+    """Print the application header."""
+    print(HEADER_COLORED)
+
+def build_menu():
+    """Build the colorized menu text (tool existence is checked here)."""
+    files = _files if _files is not None else scan_files()
+    lines = [Colors.colorize("🔧 Available Tools:", Colors.BRIGHT_WHITE), ""]
     
-    for i, (name, script, description) in enumerate(tools, 1):
+    for i, (name, script, description) in enumerate(TOOLS, 1):
         # Check if file exists
-        exists = os.path.exists(script)
-        status_color = Colors.GREEN if exists else Colors.RED
+        exists = script in files
         status_text = "✅" if exists else "❌"
         
-        print(f"  {Colors.colorize(f'{i}.', Colors.BRIGHT_BLUE)} "
-              f"{Colors.colorize(name, Colors.WHITE)} {status_text}")
-        print(f"     {Colors.colorize(description, Colors.CYAN)}")
+        lines.append(f"  {Colors.colorize(f'{i}.', Colors.BRIGHT_BLUE)} "
+                     f"{Colors.colorize(name, Colors.WHITE)} {status_text}")
+        lines.append(f"     {Colors.colorize(description, Colors.CYAN)}")
         if not exists:
-            print(f"     {Colors.colorize(f'File not found: {script}', Colors.RED)}")
-        print()
+            lines.append(f"     {Colors.colorize(f'File not found: {script}', Colors.RED)}")
+        lines.append("")
     
-    print(Colors.colorize("🔧 Quick Actions:", Colors.BRIGHT_WHITE))
-    print(f"  {Colors.colorize('c.', Colors.BRIGHT_BLUE)} Show current config summary")
-    print(f"  {Colors.colorize('h.', Colors.BRIGHT_BLUE)} Show help and usage tips")
-    print(f"  {Colors.colorize('q.', Colors.BRIGHT_BLUE)} Quit")
-    print()
+    lines.append(Colors.colorize("🔧 Quick Actions:", Colors.BRIGHT_WHITE))
+    lines.append(f"  {Colors.colorize('c.', Colors.BRIGHT_BLUE)} Show current config summary")
+    lines.append(f"  {Colors.colorize('h.', Colors.BRIGHT_BLUE)} Show help and usage tips")
+    lines.append(f"  {Colors.colorize('r.', Colors.BRIGHT_BLUE)} Refresh tool status")
+    lines.append(f"  {Colors.colorize('q.', Colors.BRIGHT_BLUE)} Quit")
+    lines.append("")
+    return '\n'.join(lines)
+
+def refresh_menu():
+    """Rescan the project directory and rebuild the menu on the next draw."""
+    global _menu_text
+    scan_files()
+    _menu_text = None
+
+def print_menu():
+    """Print the main menu."""
+    global _menu_text
+    if _menu_text is None:
+        _menu_text = build_menu()
+    print(_menu_text)
 
 def run_tool(script_name: str):
     """Run a configuration tool with security validation."""
     # Validate script path
     try:
         script_path = Path(script_name).resolve()
-        current_dir = Path.cwd()
         
         # Prevent path traversal
-        if not str(script_path).startswith(str(current_dir)):
+        if not is_inside_cwd(script_path):
             print(Colors.colorize("❌ Error: Invalid script path!", Colors.RED))
             input("Press Enter to continue...")
             return
@@ -120,7 +196,7 @@ def run_tool(script_name: str):
             capture_output=False, 
             text=True,
             timeout=300,  # 5 minute timeout
-            cwd=current_dir  # Ensure it runs in current directory
+            cwd=get_cwd()  # Ensure it runs in current directory
         )
         
         if result.returncode != 0:
@@ -140,8 +216,7 @@ def show_config_summary():
     """Show a quick configuration summary."""
     try:
         # Safely import config from config directory
-        current_dir = Path.cwd()
-        config_dir = current_dir / 'config'
+        config_dir = get_cwd() / 'config'
         config_path = config_dir / 'config.py'
         
         if not config_path.exists():
@@ -149,7 +224,7 @@ def show_config_summary():
             return
         
         # Validate it's in project directory (prevent path traversal)
-        if not str(config_path.resolve()).startswith(str(current_dir)):
+        if not is_inside_cwd(config_path.resolve()):
             print(Colors.colorize("❌ Invalid config file location!", Colors.RED))
             return
         
@@ -254,6 +329,8 @@ def main():
             elif choice == 'h':
                 clear_screen()
                 show_help()
+            elif choice == 'r':
+                refresh_menu()
             else:
                 print(Colors.colorize("❌ Invalid option. Please try again.", Colors.RED))
                 input("Press Enter to continue...")
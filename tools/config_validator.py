@@ -7,83 +7,127 @@ Validates and provides information about game configuration settings.
 SECURITY: Added safe imports and file validation.
 """
 
+import importlib.util
 import os
 import sys
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+from types import MappingProxyType
+
+# Shared project-directory helpers live with the other security rules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'security'))
+from security_config import get_cwd, is_inside_cwd, register_cwd_cache
 
 # Safely import config with validation
 def safe_import_config():
     """Safely import config module with path validation."""
     try:
-        current_dir = Path.cwd()
-        config_dir = current_dir / 'config'
+        config_dir = get_cwd() / 'config'
         config_path = config_dir / 'config.py'
         
         if not config_path.exists():
             raise ImportError("Config file not found")
         
         # Validate it's in project directory
-        if not str(config_path.resolve()).startswith(str(current_dir)):
+        if not is_inside_cwd(config_path.resolve()):
             raise ImportError("Invalid config file location")
         
-        sys.path.insert(0, str(config_dir))
-        import config
+        # Load straight from the file, without touching sys.path
+        spec = importlib.util.spec_from_file_location('timeshot_config', config_path)
+        config = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(config)
         return config
     except Exception as e:
         print(f"❌ Error importing config: {e}")
         sys.exit(1)
 
+# Directory -> names it contains, read with one scandir per directory
+_dir_cache = {}
+
+def _exists_cached(path: Path) -> bool:
+    """Check a resolved path exists using a cached listing of its parent."""
+    parent = path.parent
+    names = _dir_cache.get(parent)
+    if names is None:
+        try:
+            with os.scandir(parent) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            names = set()
+        _dir_cache[parent] = names
+    return path.name in names
+
+register_cwd_cache(_dir_cache.clear)
+
+@lru_cache(maxsize=512)
+def check_file_cached(file_path: str, file_type: str) -> str:
+    """Resolve and stat a config file path once; returns a warning or ''."""
+    try:
+        # Lexical check first: '..' escapes are rejected without touching the disk
+        if not is_inside_cwd(Path(os.path.normpath(get_cwd() / file_path))):
+            return f"{file_type} file path outside project directory: {file_path}"
+        
+        path = Path(file_path).resolve()
+        
+        # Prevent path traversal
+        if not is_inside_cwd(path):
+            return f"{file_type} file path outside project directory: {file_path}"
+        
+        if not _exists_cached(path):
+            return f"{file_type} file not found: {file_path}"
+    except Exception as e:
+        return f"Error checking {file_type} file {file_path}: {e}"
+    return ""
+
+register_cwd_cache(check_file_cached.cache_clear)
+
 # Import config safely
 config = safe_import_config()
 
+# Config namespace as a plain dict, so lookups skip attribute dispatch
+_SETTINGS = vars(config)
+
+# (setting, valid predicate, 'issue' or 'warning', message) for validate_config
+CHECKS = [
+    ('MASTER_VOLUME', lambda v: 0.0 <= v <= 1.0, 'issue', "MASTER_VOLUME must be between 0.0 and 1.0"),
+    ('SFX_VOLUME', lambda v: 0.0 <= v <= 1.0, 'issue', "SFX_VOLUME must be between 0.0 and 1.0"),
+    ('FOV_DEFAULT', lambda v: 60 <= v <= 120, 'warning', "FOV_DEFAULT outside recommended range (60-120)"),
+    ('RECOIL_VERTICAL', lambda v: v >= 0, 'issue', "RECOIL_VERTICAL cannot be negative"),
+    ('PLAYER_GRAVITY', lambda v: v >= 0, 'issue', "PLAYER_GRAVITY cannot be negative"),
+    ('MAX_SPEED', lambda v: v > 0, 'issue', "MAX_SPEED must be positive"),
+]
+
+# Fetches every checked value from the settings dict in one C-level call
+_get_check_values = itemgetter(*(name for name, _, _, _ in CHECKS))
+
+# (setting, file type) for the asset paths checked on disk
+FILE_CHECKS = [
+    ('GUNSHOT_SOUND', "Sound"),
+    ('GUN_MODEL_PATH', "Model"),
+]
+
 def validate_config():
     """Validate configuration settings and report any issues."""
     issues = []
     warnings = []
     
     # Validate numeric ranges
-    if not (0.0 <= config.MASTER_VOLUME <= 1.0):
-        issues.append("MASTER_VOLUME must be between 0.0 and 1.0")
-    
-    if not (0.0 <= config.SFX_VOLUME <= 1.0):
-        issues.append("SFX_VOLUME must be between 0.0 and 1.0")
-    
-    if config.FOV_DEFAULT < 60 or config.FOV_DEFAULT > 120:
-        warnings.append("FOV_DEFAULT outside recommended range (60-120)")
-    
-    if config.RECOIL_VERTICAL < 0:
-        issues.append("RECOIL_VERTICAL cannot be negative")
-    
-    if config.PLAYER_GRAVITY < 0:
-        issues.append("PLAYER_GRAVITY cannot be negative")
-    
-    if config.MAX_SPEED <= 0:
-        issues.append("MAX_SPEED must be positive")
+    for value, (_, is_valid, severity, message) in zip(_get_check_values(_SETTINGS), CHECKS):
+        if not is_valid(value):
+            (issues if severity == 'issue' else warnings).append(message)
     
     # Validate file paths exist (with security checks)
-    def safe_check_file(file_path: str, file_type: str):
-        """Safely check if file exists with path validation."""
+    for name, file_type in FILE_CHECKS:
+        if name not in _SETTINGS:
+            continue
+        file_path = _SETTINGS[name]
         try:
-            path = Path(file_path).resolve()
-            current_dir = Path.cwd()
-            
-            # Prevent path traversal
-            if not str(path).startswith(str(current_dir)):
-                warnings.append(f"{file_type} file path outside project directory: {file_path}")
-                return
-            
-            if not path.exists():
-                warnings.append(f"{file_type} file not found: {file_path}")
-        except Exception as e:
-            warnings.append(f"Error checking {file_type} file {file_path}: {e}")
-    
-    # Check sound files
-    if hasattr(config, 'GUNSHOT_SOUND'):
-        safe_check_file(config.GUNSHOT_SOUND, "Sound")
-    
-    # Check model files  
-    if hasattr(config, 'GUN_MODEL_PATH'):
-        safe_check_file(config.GUN_MODEL_PATH, "Model")
+            warning = check_file_cached(file_path, file_type)
+        except TypeError as e:
+            warning = f"Error checking {file_type} file {file_path}: {e}"
+        if warning:
+            warnings.append(warning)
     
     # Report results
     if issues:
@@ -103,93 +147,89 @@ def validate_config():
 
 def print_config_summary():
     """Print a summary of key configuration settings."""
-    print("🎮 Game Configuration Summary")
-    print("=" * 40)
-    
-    # Safe attribute access with defaults
-    def safe_get(attr_name, default="Unknown"):
-        return getattr(config, attr_name, default)
-    
-    print(f"Display:")
-    print(f"  Resolution: {safe_get('WINDOW_WIDTH', 1920)}x{safe_get('WINDOW_HEIGHT', 1080)}")
-    print(f"  FOV: {safe_get('FOV_DEFAULT', 90)}°")
-    print(f"  Fullscreen: {safe_get('WINDOW_FULLSCREEN', False)}")
-    
-    print(f"\nAudio:")
-    master_vol = safe_get('MASTER_VOLUME', 1.0)
-    sfx_vol = safe_get('SFX_VOLUME', 0.8)
-    print(f"  Master Volume: {master_vol * 100:.0f}%")
-    print(f"  SFX Volume: {sfx_vol * 100:.0f}%")
-    
-    print(f"\nPlayer:")
-    print(f"  Max Speed: {safe_get('MAX_SPEED', 7)}")
-    print(f"  Jump Height: {safe_get('PLAYER_JUMP_HEIGHT', 2)}")
-    print(f"  Sprint Multiplier: {safe_get('SPRINT_MULTIPLIER', 1.8)}x")
-    
-    print(f"\nWeapons:")
-    print(f"  Recoil Enabled: {safe_get('RECOIL_ENABLED', True)}")
-    print(f"  Vertical Recoil: {safe_get('RECOIL_VERTICAL', 2.5)}")
-    print(f"  Horizontal Recoil: {safe_get('RECOIL_HORIZONTAL', 1.0)}")
-    
-    print(f"\nGame Modes:")
-    casual_enabled = safe_get('CASUAL_MODE_ENABLED', True)
-    timed_enabled = safe_get('TIMED_MODE_ENABLED', True)
-    print(f"  Casual Mode: {'Enabled' if casual_enabled else 'Disabled'}")
-    print(f"  Timed Mode: {'Enabled' if timed_enabled else 'Disabled'}")
-    print(f"  Timer Duration: {safe_get('TIMER_DURATION', 60)}s")
-    
-    print(f"\nAdvanced Movement:")
-    slide_enabled = safe_get('SLIDE_ENABLED', True)
-    dash_enabled = safe_get('DASH_ENABLED', True)
-    wall_run_enabled = safe_get('WALL_RUN_ENABLED', True)
-    print(f"  Sliding: {'Enabled' if slide_enabled else 'Disabled'}")
-    print(f"  Dashing: {'Enabled' if dash_enabled else 'Disabled'}")
-    print(f"  Wall Running: {'Enabled' if wall_run_enabled else 'Disabled'}")
-    
-    print(f"\nDebug:")
-    debug_mode = safe_get('DEBUG_MODE', False)
-    show_collision = safe_get('SHOW_COLLISION_BOXES', False)
-    print(f"  Debug Mode: {'Enabled' if debug_mode else 'Disabled'}")
-    print(f"  Show Collision Boxes: {'Yes' if show_collision else 'No'}")
+    # Safe setting access with defaults
+    safe_get = _SETTINGS.get
+    
+    def on_off(name, default=True):
+        return 'Enabled' if safe_get(name, default) else 'Disabled'
+    
+    # Build the whole summary and write it in one call
+    summary = f"""🎮 Game Configuration Summary
+{"=" * 40}
+Display:
+  Resolution: {safe_get('WINDOW_WIDTH', 1920)}x{safe_get('WINDOW_HEIGHT', 1080)}
+  FOV: {safe_get('FOV_DEFAULT', 90)}°
+  Fullscreen: {safe_get('WINDOW_FULLSCREEN', False)}
+
+Audio:
+  Master Volume: {safe_get('MASTER_VOLUME', 1.0) * 100:.0f}%
+  SFX Volume: {safe_get('SFX_VOLUME', 0.8) * 100:.0f}%
+
+Player:
+  Max Speed: {safe_get('MAX_SPEED', 7)}
+  Jump Height: {safe_get('PLAYER_JUMP_HEIGHT', 2)}
+  Sprint Multiplier: {safe_get('SPRINT_MULTIPLIER', 1.8)}x
+
+Weapons:
+  Recoil Enabled: {safe_get('RECOIL_ENABLED', True)}
+  Vertical Recoil: {safe_get('RECOIL_VERTICAL', 2.5)}
+  Horizontal Recoil: {safe_get('RECOIL_HORIZONTAL', 1.0)}
+
+Game Modes:
+  Casual Mode: {on_off('CASUAL_MODE_ENABLED')}
+  Timed Mode: {on_off('TIMED_MODE_ENABLED')}
+  Timer Duration: {safe_get('TIMER_DURATION', 60)}s
+
+Advanced Movement:
+  Sliding: {on_off('SLIDE_ENABLED')}
+  Dashing: {on_off('DASH_ENABLED')}
+  Wall Running: {on_off('WALL_RUN_ENABLED')}
+
+Debug:
+  Debug Mode: {on_off('DEBUG_MODE', False)}
+  Show Collision Boxes: {'Yes' if safe_get('SHOW_COLLISION_BOXES', False) else 'No'}
+"""
+    sys.stdout.write(summary)
+
+# Recommended settings per quality preset (read-only, shared by all callers)
+_QUALITY_PRESETS = MappingProxyType({
+    'low': MappingProxyType({
+        'SHADOW_QUALITY': 'low',
+        'ANTI_ALIASING': False,
+        'MOTION_BLUR': False,
+        'PARTICLE_EFFECTS': False,
+        'RENDER_DISTANCE': 500,
+        'MAX_PARTICLES': 100
+    }),
+    'medium': MappingProxyType({
+        'SHADOW_QUALITY': 'medium',
+        'ANTI_ALIASING': True,
+        'MOTION_BLUR': True,
+        'PARTICLE_EFFECTS': True,
+        'RENDER_DISTANCE': 750,
+        'MAX_PARTICLES': 500
+    }),
+    'high': MappingProxyType({
+        'SHADOW_QUALITY': 'high',
+        'ANTI_ALIASING': True,
+        'MOTION_BLUR': True,
+        'PARTICLE_EFFECTS': True,
+        'RENDER_DISTANCE': 1000,
+        'MAX_PARTICLES': 1000
+    }),
+    'ultra': MappingProxyType({
+        'SHADOW_QUALITY': 'high',
+        'ANTI_ALIASING': True,
+        'MOTION_BLUR': True,
+        'PARTICLE_EFFECTS': True,
+        'RENDER_DISTANCE': 1500,
+        'MAX_PARTICLES': 2000
+    })
+})
 
 def get_quality_preset_settings(preset):
     """Get recommended settings for different quality presets."""
-    presets = {
-        'low': {
-            'SHADOW_QUALITY': 'low',
-            'ANTI_ALIASING': False,
-            'MOTION_BLUR': False,
-            'PARTICLE_EFFECTS': False,
-            'RENDER_DISTANCE': 500,
-            'MAX_PARTICLES': 100
-        },
-        'medium': {
-            'SHADOW_QUALITY': 'medium',
-            'ANTI_ALIASING': True,
-            'MOTION_BLUR': True,
-            'PARTICLE_EFFECTS': True,
-            'RENDER_DISTANCE': 750,
-            'MAX_PARTICLES': 500
-        },
-        'high': {
-            'SHADOW_QUALITY': 'high',
-            'ANTI_ALIASING': True,
-            'MOTION_BLUR': True,
-            'PARTICLE_EFFECTS': True,
-            'RENDER_DISTANCE': 1000,
-            'MAX_PARTICLES': 1000
-        },
-        'ultra': {
-            'SHADOW_QUALITY': 'high',
-            'ANTI_ALIASING': True,
-            'MOTION_BLUR': True,
-            'PARTICLE_EFFECTS': True,
-            'RENDER_DISTANCE': 1500,
-            'MAX_PARTICLES': 2000
-        }
-    }
-    
-    return presets.get(preset, presets['medium'])
+    return _QUALITY_PRESETS.get(preset, _QUALITY_PRESETS['medium'])
 
 if __name__ == "__main__":
     print_config_summary()
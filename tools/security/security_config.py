@@ -6,10 +6,79 @@ Security Configuration
 Security settings and validation rules for the game configuration system.
 """
 
+import datetime
+import os
 import re
+import time
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+# Project directory, resolved once; call invalidate_cwd_cache() after os.chdir
+_CWD = Path.cwd().resolve()
+
+# Clear callables for every cache whose entries depend on the project directory
+_cwd_cache_clears = []
+
+def get_cwd() -> Path:
+    """Return the cached, resolved project directory."""
+    return _CWD
+
+def is_inside_cwd(path: Path) -> bool:
+    """Check whether an absolute path lies within the project directory."""
+    # Compares path parts, so '/proj2' is not mistaken for a child of '/proj'
+    try:
+        path.relative_to(_CWD)
+        return True
+    except ValueError:
+        return False
+
+def register_cwd_cache(cache_clear):
+    """Have invalidate_cwd_cache() call cache_clear when the directory changes."""
+    _cwd_cache_clears.append(cache_clear)
+    return cache_clear
+
+def invalidate_cwd_cache():
+    """Re-read the working directory after a chdir and clear every dependent cache."""
+    global _CWD
+    _CWD = Path.cwd().resolve()
+    for cache_clear in _cwd_cache_clears:
+        cache_clear()
+
+@lru_cache(maxsize=256)
+def _resolve_dir(dir_path: str) -> Path:
+    """Resolve a directory once; files in it then only need their own lstat."""
+    return Path(dir_path).resolve()
+
+def _resolve_path(file_path: str) -> Path:
+    """
+    Resolve a file path, reusing the cached resolution of its directory.
+    
+    Paths with '..' components or a symlinked final component take the full
+    Path.resolve() route, so symlink escapes are still caught.
+    """
+    if '..' in Path(file_path).parts:
+        return Path(file_path).resolve()
+    
+    head, tail = os.path.split(os.path.normpath(file_path))
+    if not tail or tail == '.' or os.path.islink(file_path):
+        return Path(file_path).resolve()
+    return _resolve_dir(head or '.') / tail
+
+# Precompiled validation patterns
+_SETTING_NAME_RE = re.compile(r'^[A-Z_][A-Z0-9_]*$', re.ASCII)
+_SAFE_LITERAL_RE = re.compile(
+    r'^(?:'
+    r'\d+'                 # Integer
+    r'|\d+\.\d+'           # Float
+    r'|True|False'         # Boolean
+    r'|None'               # None
+    r'|["\'][^"\']*["\']'  # Simple string
+    r')$',
+    re.ASCII
+)
+
 class SecurityConfig:
     """Security configuration and validation rules."""
     
@@ -50,6 +119,14 @@ class SecurityConfig:
         'hasattr',
     ]
     
+    # All dangerous patterns as one alternation, so a single scan finds any of them
+    _DANGER_RE = re.compile('|'.join(map(re.escape, DANGEROUS_PATTERNS)))
+    # Byte-level, case-insensitive variant for file system paths (patterns are ASCII)
+    _DANGER_BYTES_RE = re.compile(b'|'.join(re.escape(p.encode('ascii')) for p in DANGEROUS_PATTERNS), re.IGNORECASE)
+    
+    # Deletion table for null bytes, control characters and DEL (tab/newline/CR kept)
+    _SANITIZE_TRANS = str.maketrans('', '', ''.join(chr(c) for c in range(32) if c not in (9, 10, 13)) + '\x7f')
+    
     # Allowed setting types
     ALLOWED_SETTING_TYPES = (bool, int, float, str)
     
@@ -67,27 +144,50 @@ class SecurityConfig:
     def validate_file_path(file_path: str, allowed_extensions: set = None) -> Tuple[bool, str]:
         """Validate file path for security."""
         try:
-            path = Path(file_path).resolve()
-            current_dir = Path.cwd()
+            location_error, suffix, danger_error = SecurityConfig._check_path_cached(file_path)
+        except Exception as e:
+            return False, f"Path validation error: {e}"
+        
+        if location_error:
+            return False, location_error
+        
+        # Check extension if specified
+        if allowed_extensions and suffix not in allowed_extensions:
+            return False, f"Invalid file extension. Allowed: {allowed_extensions}"
+        
+        if danger_error:
+            return False, danger_error
+        
+        return True, "Valid"
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _check_path_cached(file_path: str) -> Tuple[str, str, str]:
+        """
+        Resolve and scan a path once (memoized; cleared by invalidate_cwd_cache).
+        
+        Returns (location_error, lowercase suffix, dangerous_pattern_error),
+        with empty strings where a check passed.
+        """
+        try:
+            # Lexical check first: '..' escapes are rejected without touching the disk
+            if not is_inside_cwd(Path(os.path.normpath(_CWD / file_path))):
+                return "Path outside project directory", "", ""
             
-            # Prevent path traversal
-            if not str(path).startswith(str(current_dir)):
-                return False, "Path outside project directory"
+            path = _resolve_path(file_path)
             
-            # Check extension if specified
-            if allowed_extensions and path.suffix.lower() not in allowed_extensions:
-                return False, f"Invalid file extension. Allowed: {allowed_extensions}"
+            # Prevent path traversal
+            if not is_inside_cwd(path):
+                return "Path outside project directory", "", ""
             
             # Check if path contains dangerous patterns
-            path_str = str(path).lower()
-            for pattern in SecurityConfig.DANGEROUS_PATTERNS:
-                if pattern in path_str:
-                    return False, f"Path contains dangerous pattern: {pattern}"
+            match = SecurityConfig._DANGER_BYTES_RE.search(os.fsencode(path))
+            danger_error = f"Path contains dangerous pattern: {match.group(0).decode('ascii').lower()}" if match else ""
             
-            return True, "Valid"
+            return "", path.suffix.lower(), danger_error
             
         except Exception as e:
-            return False, f"Path validation error: {e}"
+            return f"Path validation error: {e}", "", ""
     
     @staticmethod
     def validate_setting_name(name: str) -> Tuple[bool, str]:
@@ -95,10 +195,16 @@ class SecurityConfig:
         if not isinstance(name, str):
             return False, "Setting name must be string"
         
+        return SecurityConfig._validate_setting_name_cached(name)
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _validate_setting_name_cached(name: str) -> Tuple[bool, str]:
+        """Validate a setting name string (memoized; names come from a small vocabulary)."""
         if len(name) > SecurityConfig.MAX_SETTING_NAME_LENGTH:
             return False, f"Setting name too long (max {SecurityConfig.MAX_SETTING_NAME_LENGTH})"
         
-        if not re.match(r'^[A-Z_][A-Z0-9_]*$', name):
+        if not _SETTING_NAME_RE.match(name):
             return False, "Setting name must be uppercase with underscores only"
         
         return True, "Valid"
@@ -116,10 +222,9 @@ class SecurityConfig:
                 return False, f"String too long (max {SecurityConfig.MAX_INPUT_LENGTH})"
             
             # Check for dangerous patterns
-            value_lower = value.lower()
-            for pattern in SecurityConfig.DANGEROUS_PATTERNS:
-                if pattern in value_lower:
-                    return False, f"String contains dangerous pattern: {pattern}"
+            match = SecurityConfig._DANGER_RE.search(value.lower())
+            if match:
+                return False, f"String contains dangerous pattern: {match.group(0)}"
         
         # Numeric validation
         if isinstance(value, (int, float)):
@@ -127,53 +232,57 @@ class SecurityConfig:
                 return False, "Numeric value out of reasonable range"
             
             # Specific range validation
-            setting_lower = setting_name.lower()
-            for range_key, (min_val, max_val) in SecurityConfig.NUMERIC_RANGES.items():
-                if range_key in setting_lower:
-                    if not (min_val <= value <= max_val):
-                        return False, f"Value must be between {min_val} and {max_val}"
+            for min_val, max_val in SecurityConfig._ranges_for_setting(setting_name):
+                if not (min_val <= value <= max_val):
+                    return False, f"Value must be between {min_val} and {max_val}"
         
         return True, "Valid"
     
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _ranges_for_setting(setting_name: str) -> Tuple[Tuple[float, float], ...]:
+        """Return the NUMERIC_RANGES whose key appears in the setting name (memoized)."""
+        setting_lower = setting_name.lower()
+        return tuple(limits for range_key, limits in SecurityConfig.NUMERIC_RANGES.items()
+                     if range_key in setting_lower)
+    
     @staticmethod
     def sanitize_input(user_input: str) -> str:
         """Sanitize user input."""
         if not isinstance(user_input, str):
             return ""
         
-        # Limit length
-        sanitized = user_input[:SecurityConfig.MAX_INPUT_LENGTH]
-        
-        # Remove null bytes and control characters
-        sanitized = ''.join(char for char in sanitized if ord(char) >= 32 or char in '\t\n\r')
-        
-        # Strip whitespace
-        sanitized = sanitized.strip()
+        # Limit length, remove null bytes and control characters, strip whitespace
+        sanitized = user_input[:SecurityConfig.MAX_INPUT_LENGTH].translate(SecurityConfig._SANITIZE_TRANS).strip()
         
         return sanitized
     
     @staticmethod
     def is_safe_for_eval(value_str: str) -> bool:
         """Check if string is safe for evaluation."""
+        return SecurityConfig._is_safe_for_eval_cached(value_str)
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _is_safe_for_eval_cached(value_str: str) -> bool:
+        """Check a literal string against the safe patterns (memoized per string)."""
         # Only allow simple literals
-        safe_patterns = [
-            r'^\d+$',  # Integer
-            r'^\d+\.\d+$',  # Float
-            r'^True$|^False$',  # Boolean
-            r'^None$',  # None
-            r'^["\'][^"\']*["\']$',  # Simple string
-        ]
-        
-        return any(re.match(pattern, value_str.strip()) for pattern in safe_patterns)
+        return _SAFE_LITERAL_RE.match(value_str.strip()) is not None
+
+# Path caches resolve against the project directory
+register_cwd_cache(_resolve_dir.cache_clear)
+register_cwd_cache(SecurityConfig._check_path_cached.cache_clear)
 
 # Security logging
 class SecurityLogger:
     """Simple security event logger."""
     
+    # Line-buffered log handle, opened on the first event and reused
+    _log_file = None
+    
     @staticmethod
     def log_security_event(event_type: str, details: str, severity: str = "INFO"):
         """Log security events."""
-        import datetime
         timestamp = datetime.datetime.now().isoformat()
         log_entry = f"[{timestamp}] SECURITY-{severity}: {event_type} - {details}"
         
@@ -182,8 +291,9 @@ class SecurityLogger:
         
         # Could also write to file
         try:
-            with open('security.log', 'a', encoding='utf-8') as f:
-                f.write(log_entry + '\n')
+            if SecurityLogger._log_file is None:
+                SecurityLogger._log_file = open('security.log', 'a', encoding='utf-8', buffering=1)
+            SecurityLogger._log_file.write(log_entry + '\n')
         except Exception:
             pass  # Don't fail if logging fails
 
@@ -194,23 +304,22 @@ class RateLimiter:
     def __init__(self, max_operations: int = 100, time_window: int = 60):
         self.max_operations = max_operations
         self.time_window = time_window
-        self.operations = []
+        self.time_window_ns = int(time_window * 1_000_000_000)
+        # Ring buffer of the most recent allowed operation times (monotonic ns)
+        self.operations = deque(maxlen=max(max_operations, 0))
     
     def is_allowed(self) -> bool:
         """Check if operation is allowed under rate limit."""
-        import time
-        current_time = time.time()
+        current_time = time.monotonic_ns()
         
-        # Remove old operations outside time window
-        self.operations = [op_time for op_time in self.operations 
-                          if current_time - op_time < self.time_window]
+        # Full buffer whose oldest entry is still inside the window -> over limit
+        if len(self.operations) >= self.max_operations:
+            if not self.operations or current_time - self.operations[0] < self.time_window_ns:
+                return False
         
-        # Check if under limit
-        if len(self.operations) < self.max_operations:
-            self.operations.append(current_time)
-            return True
-        
-        return False
+        # Appending to a full buffer drops the oldest operation
+        self.operations.append(current_time)
+        return True
 
 # Global instances
 security_config = SecurityConfig()
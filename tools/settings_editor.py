@@ -17,6 +17,68 @@ import shutil
 from pathlib import Path
 from typing import Dict, Any, List, Tuple, Union
 
+# ANSI clear screen + cursor home; avoids spawning a shell per redraw
+_CLEAR_SEQ = '\033[2J\033[H'
+_VT_AVAILABLE = sys.stdout.isatty()
+_vt_checked = False
+
+def _enable_vt():
+    """Turn on VT escape processing once, on the first clear (Windows 10+ consoles need it)."""
+    global _VT_AVAILABLE, _vt_checked
+    _vt_checked = True
+    if os.name != 'nt':
+        return
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        # 0x0004 = ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        if not (kernel32.GetConsoleMode(handle, ctypes.byref(mode)) and
+                kernel32.SetConsoleMode(handle, mode.value | 0x0004)):
+            _VT_AVAILABLE = False
+    except (AttributeError, OSError):
+        _VT_AVAILABLE = False
+
+# Precompiled config parsing patterns
+# One scan over the whole file: indented 'NAME = value  # comment' lines
+_SETTING_RE_MULTI = re.compile(r'^[ \t]*([A-Z_][A-Z0-9_]*)[ \t]*=[ \t]*([^ \t\n].*?)(?:[ \t]*#.*)?[ \t]*$', re.MULTILINE)
+# Same line shape, but keeps the trailing comment (group 3) for save_settings
+_SETTING_LINE_RE_MULTI = re.compile(r'^[ \t]*([A-Z_][A-Z0-9_]*)[ \t]*=[ \t]*([^ \t\n].*?)([ \t]*#.*?)?[ \t]*$', re.MULTILINE)
+_NAME_RE = re.compile(r'[A-Z_][A-Z0-9_]*')  # use with fullmatch
+# Suspicious content in string settings, matched case-insensitively in one scan
+_DANGEROUS_RE = re.compile(r'import|exec|eval|__|subprocess|os\.system', re.IGNORECASE)
+_ALLOWED_SETTING_TYPES = (bool, int, float, str)
+# Marks a setting value whose literal hasn't been evaluated yet
+_NOT_LITERAL = object()
+
+# Accepted spellings when editing boolean settings
+_TRUE_STRINGS = frozenset({'true', 't', '1', 'yes', 'y', 'on'})
+_FALSE_STRINGS = frozenset({'false', 'f', '0', 'no', 'n', 'off'})
+
+# Spellings of Python literals accepted in the config file
+_TRUE_LITERALS = frozenset({'True', 'true'})
+_FALSE_LITERALS = frozenset({'False', 'false'})
+
+# Ursina expressions (kept verbatim as strings, never evaluated)
+_URSINA_PREFIXES = ('color.', 'Vec3(', 'window.')
+
+# Settings that must stay strictly positive
+_POSITIVE_SETTINGS = frozenset({'MAX_SPEED', 'PLAYER_JUMP_HEIGHT'})
+
+def _parse_bool(text: str) -> bool:
+    """Parse a user-entered boolean."""
+    text = text.lower()
+    if text in _TRUE_STRINGS:
+        return True
+    if text in _FALSE_STRINGS:
+        return False
+    raise ValueError("Invalid boolean value")
+
+def _parse_text(text: str) -> str:
+    """Parse a user-entered string (quotes optional)."""
+    return text.strip("'\"")
+
 # Color codes for terminal output
 class Colors:
     # Basic colors
@@ -53,25 +115,97 @@ class Colors:
     def colorize(text: str, color: str) -> str:
         """Apply color to text."""
         return f"{color}{text}{Colors.RESET}"
+    
+    # Prebound formatters for the colors the editor uses: fmt_cyan(text) is a
+    # single str.format call instead of colorize()'s Python-level f-string
+    fmt_red = '\033[31m{}\033[0m'.format
+    fmt_green = '\033[32m{}\033[0m'.format
+    fmt_yellow = '\033[33m{}\033[0m'.format
+    fmt_cyan = '\033[36m{}\033[0m'.format
+    fmt_white = '\033[37m{}\033[0m'.format
+    fmt_bright_green = '\033[92m{}\033[0m'.format
+    fmt_bright_blue = '\033[94m{}\033[0m'.format
+    fmt_bright_cyan = '\033[96m{}\033[0m'.format
+    fmt_bright_white = '\033[97m{}\033[0m'.format
+    fmt_dim = '\033[2m{}\033[0m'.format
+
+# Quick presets offered by apply_preset: key -> (name, settings)
+PRESETS = {
+    '1': ('Realistic Shooting', {
+        'RECOIL_VERTICAL': 4.0,
+        'RECOIL_HORIZONTAL': 2.0,
+        'RECOIL_RECOVERY_SPEED': 4.0,
+        'MOUSE_SENSITIVITY': 30,
+        'SFX_VOLUME': 1.0
+    }),
+    '2': ('Arcade Mode', {
+        'MAX_SPEED': 12,
+        'SPRINT_MULTIPLIER': 2.5,
+        'DASH_FORCE': 80,
+        'RECOIL_VERTICAL': 1.0,
+        'FOV_DEFAULT': 100
+    }),
+    '3': ('Precision Challenge', {
+        'MAX_SPEED': 4,
+        'RECOIL_VERTICAL': 1.5,
+        'MOUSE_SENSITIVITY': 25,
+        'TARGET_SIZE': 0.3,
+        'TIMER_DURATION': 120
+    }),
+    '4': ('Beginner Friendly', {
+        'RECOIL_VERTICAL': 1.0,
+        'RECOIL_HORIZONTAL': 0.3,
+        'TARGET_SIZE': 0.8,
+        'TIMER_DURATION': 90,
+        'MAX_SPEED': 5
+    })
+}
+
+# Value colors in the category listing (bools are green/red by value)
+_TYPE_COLOR = {int: Colors.CYAN, float: Colors.CYAN, str: Colors.YELLOW}
+
+# One listing row: index, white name padded to 30 (escape codes included), colored value
+_ROW_FMT = (f"  {Colors.BRIGHT_BLUE}{{0:2d}}.{Colors.RESET} "
+            f"{{1:30s}} = {{2}}{{3}}{Colors.RESET}\n").format
+
+# Edit hints shown per setting type
+BOOL_HINT = "💡 Hint: Enter 'true' or 'false'"
+NUMBER_HINT = "💡 Hint: Enter a number"
+TEXT_HINT = "💡 Hint: Enter text (quotes optional)"
 
 class SettingsEditor:
+    # Setting type -> (edit hint, parser for the new value)
+    _TYPE_DISPATCH = {
+        bool: (BOOL_HINT, _parse_bool),
+        int: (NUMBER_HINT, int),
+        float: (NUMBER_HINT, float),
+        str: (TEXT_HINT, _parse_text),
+    }
+    
     # Security constants
     MAX_FILE_SIZE = 1024 * 1024  # 1MB limit
     MAX_INPUT_LENGTH = 1000
-    ALLOWED_SETTING_TYPES = (bool, int, float, str)
+    ALLOWED_SETTING_TYPES = _ALLOWED_SETTING_TYPES
     
     def __init__(self):
-        self.config_file = self._validate_config_path('config.py')
+        self.config_path = self._validate_config_path('config.py')
+        # Sibling files used by save_settings, derived once
+        self._backup_path = self.config_path.with_suffix('.py.backup')
+        self._temp_path = self.config_path.with_suffix('.py.tmp')
         self.settings = {}
         self.categories = {}
         self.current_category = None
         self.modified = False
+        # setting name -> (value, is_valid, message) from the last validate_setting call
+        self._validation_cache = {}
+        # setting name -> (value, colored name, value color, display string) for the category listing
+        self._display_cache = {}
         
         # Load current settings
         self.load_settings()
         self.organize_categories()
     
-    def _validate_config_path(self, path: str) -> str:
+    def _validate_config_path(self, path: str) -> Path:
         """Validate and sanitize the config file path to prevent path traversal."""
         try:
             current_dir = Path.cwd()
@@ -82,17 +216,19 @@ class SettingsEditor:
             else:
                 config_path = Path(path).resolve()
             
-            # Prevent path traversal attacks
-            if not str(config_path).startswith(str(current_dir)):
-                raise ValueError("Config file must be in project directory")
+            # Prevent path traversal attacks (compares path parts, not string prefixes)
+            try:
+                config_path.relative_to(current_dir)
+            except ValueError:
+                raise ValueError("Config file must be in project directory") from None
             
             # Ensure it's a Python file
             if config_path.suffix != '.py':
                 raise ValueError("Config file must be a Python file")
             
-            return str(config_path)
+            return config_path
         except Exception as e:
-            print(Colors.colorize(f"❌ Invalid config path: {e}", Colors.RED))
+            print(Colors.fmt_red(f"❌ Invalid config path: {e}"))
             sys.exit(1)
     
     def _safe_literal_eval(self, value_str: str) -> Any:
@@ -100,13 +236,13 @@ class SettingsEditor:
         value_str = value_str.strip()
         
         # Handle special Ursina types as strings
-        if any(prefix in value_str for prefix in ['color.', 'Vec3(', 'window.']):
+        if value_str.startswith(_URSINA_PREFIXES):
             return value_str
         
         # Handle boolean literals
-        if value_str in ('True', 'true'):
+        if value_str in _TRUE_LITERALS:
             return True
-        elif value_str in ('False', 'false'):
+        elif value_str in _FALSE_LITERALS:
             return False
         elif value_str == 'None':
             return None
@@ -120,19 +256,18 @@ class SettingsEditor:
     
     def _is_valid_setting_name(self, name: str) -> bool:
         """Validate setting name to prevent injection."""
-        return bool(re.match(r'^[A-Z_][A-Z0-9_]*$', name)) and len(name) <= 50
+        return len(name) <= 50 and _NAME_RE.fullmatch(name) is not None
     
     def _is_valid_setting_value(self, value: Any) -> bool:
         """Validate setting value type and content."""
-        if not isinstance(value, self.ALLOWED_SETTING_TYPES):
+        if not isinstance(value, _ALLOWED_SETTING_TYPES):
             return False
         
         if isinstance(value, str):
             if len(value) > self.MAX_INPUT_LENGTH:
                 return False
             # Check for suspicious content
-            dangerous_patterns = ['import', 'exec', 'eval', '__', 'subprocess', 'os.system']
-            if any(pattern in value.lower() for pattern in dangerous_patterns):
+            if _DANGEROUS_RE.search(value):
                 return False
         
         if isinstance(value, (int, float)):
@@ -144,99 +279,133 @@ class SettingsEditor:
     def load_settings(self):
         """Load settings from config.py file with security validation."""
         try:
-            config_path = Path(self.config_file)
-            
-            # Check file size to prevent DoS
-            if config_path.stat().st_size > self.MAX_FILE_SIZE:
-                raise ValueError(f"Config file too large (max {self.MAX_FILE_SIZE} bytes)")
+            # Size the read from the open file; the same fstat also guards against DoS
+            with open(self.config_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > self.MAX_FILE_SIZE:
+                    raise ValueError(f"Config file too large (max {self.MAX_FILE_SIZE} bytes)")
+                content = f.read(size).decode('utf-8')
             
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Binary reads skip newline translation, so normalize Windows line endings here
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
             
-            # Parse settings using regex with validation
-            pattern = r'^([A-Z_][A-Z0-9_]*)\s*=\s*(.+?)(?:\s*#.*)?$'
-            
-            for line_num, line in enumerate(content.split('\n'), 1):
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                    
-                match = re.match(pattern, line)
-                if match:
-                    key, value = match.groups()
-                    
-                    # Validate setting name
-                    if not self._is_valid_setting_name(key):
-                        print(f"Warning: Skipping invalid setting name: {key}")
-                        continue
-                    
-                    # Safely parse value
-                    try:
-                        parsed_value = self._safe_literal_eval(value)
-                        
-                        # Validate value
-                        if self._is_valid_setting_value(parsed_value):
-                            self.settings[key] = parsed_value
-                        else:
-                            print(f"Warning: Skipping invalid value for {key}: {value}")
-                            
-                    except Exception as e:
-                        print(f"Warning: Could not parse {key} on line {line_num}: {e}")
+            # Parse the whole file once; fall back to the line regex if it isn't valid Python
+            try:
+                tree = ast.parse(content)
+            except SyntaxError:
+                self._load_settings_regex(content)
+            else:
+                self._load_settings_ast(content, tree)
         
         except FileNotFoundError:
-            print(Colors.colorize("❌ Config file not found!", Colors.RED))
+            print(Colors.fmt_red("❌ Config file not found!"))
             sys.exit(1)
         except PermissionError:
-            print(Colors.colorize("❌ Permission denied reading config file!", Colors.RED))
+            print(Colors.fmt_red("❌ Permission denied reading config file!"))
             sys.exit(1)
         except Exception as e:
-            print(Colors.colorize(f"❌ Error loading config: {e}", Colors.RED))
+            print(Colors.fmt_red(f"❌ Error loading config: {e}"))
             sys.exit(1)
     
+    def _load_settings_ast(self, content: str, tree: ast.Module):
+        """Collect top-level 'NAME = value' assignments from a parsed config."""
+        for node in tree.body:
+            if not (isinstance(node, ast.Assign) and len(node.targets) == 1
+                    and isinstance(node.targets[0], ast.Name)):
+                continue
+            key = node.targets[0].id
+            if not _NAME_RE.fullmatch(key):
+                continue
+            
+            # Source text of the value, exactly as written (Ursina expressions are kept verbatim)
+            value = ast.get_source_segment(content, node.value)
+            try:
+                # Plain literals evaluate straight from the parsed node, without a re-parse
+                parsed_value = ast.literal_eval(node.value)
+            except (ValueError, TypeError, SyntaxError):
+                parsed_value = _NOT_LITERAL
+            self._store_setting(key, value, node.lineno, parsed_value)
+    
+    def _load_settings_regex(self, content: str):
+        """Collect 'NAME = value' lines with the line regex (for files that don't parse)."""
+        for match in _SETTING_RE_MULTI.finditer(content):
+            key, value = match.groups()
+            line_num = content.count('\n', 0, match.start()) + 1
+            self._store_setting(key, value, line_num)
+    
+    def _store_setting(self, key: str, value: str, line_num: int, parsed_value: Any = _NOT_LITERAL):
+        """Validate one setting and keep it; parsed_value is the literal if already known."""
+        # Validate setting name
+        if not self._is_valid_setting_name(key):
+            print(f"Warning: Skipping invalid setting name: {key}")
+            return
+        
+        # Safely parse value
+        try:
+            if parsed_value is _NOT_LITERAL:
+                parsed_value = self._safe_literal_eval(value)
+            
+            # Validate value
+            if self._is_valid_setting_value(parsed_value):
+                self.settings[key] = parsed_value
+            else:
+                print(f"Warning: Skipping invalid value for {key}: {value}")
+                
+        except Exception as e:
+            print(f"Warning: Could not parse {key} on line {line_num}: {e}")
+    
+    # Category -> name fragments that place a setting in it, checked in order
+    CATEGORY_RULES = (
+        ('Display & Graphics', ('WINDOW_', 'FOV_', 'SHADOW_', 'RENDER_', 'ANTI_')),
+        ('Audio Settings', ('MASTER_', 'SFX_', 'MUSIC_', 'AUDIO_', 'SOUND')),
+        ('Environment', ('MAP_', 'GROUND_', 'SKY_', 'SUN_', 'FOG_', 'WIND_')),
+        ('Player Settings', ('PLAYER_', 'MOUSE_', 'CAMERA_', 'JUMP_', 'CROUCH_')),
+        ('Movement Mechanics', ('SLIDE_', 'DASH_', 'WALL_RUN_', 'ACCELERATION', 'FRICTION', 'MAX_SPEED')),
+        ('Weapon Systems', ('GUN_', 'RECOIL_', 'SHOOTING_', 'BULLET_', 'MUZZLE_')),
+        ('Target System', ('TARGET_',)),
+        ('Game Modes', ('CASUAL_', 'TIMED_', 'TIMER_', 'SCORE_', 'POINTS_')),
+        ('User Interface', ('SHOW_', 'MENU_', 'CROSSHAIR_', 'HUD_')),
+        ('Performance & Debug', ('DEBUG_', 'QUALITY_', 'MAX_', 'ENABLE_')),
+    )
+    # Fallback: one compiled fragment search per category, built once for the class
+    _CATEGORY_SEARCHES = tuple(
+        (category, re.compile('|'.join(map(re.escape, fragments))).search)
+        for category, fragments in CATEGORY_RULES
+    )
+    DEFAULT_CATEGORY = 'Display & Graphics'
+    
     def organize_categories(self):
         """Organize settings into categories based on prefixes and comments."""
-        self.categories = {
-            'Display & Graphics': [],
-            'Audio Settings': [],
-            'Environment': [],
-            'Player Settings': [],
-            'Movement Mechanics': [],
-            'Weapon Systems': [],
-            'Target System': [],
-            'Game Modes': [],
-            'User Interface': [],
-            'Performance & Debug': []
-        }
-        
-        # Categorize settings based on prefixes
+        self.categories = {category: [] for category, _ in self.CATEGORY_RULES}
+        
+        # Categorize settings: a real prefix match wins (one C-level startswith
+        # per category), then a fragment anywhere in the name (e.g. GUNSHOT_SOUND)
         for key in self.settings:
-            if any(prefix in key for prefix in ['WINDOW_', 'FOV_', 'SHADOW_', 'RENDER_', 'ANTI_']):
-                self.categories['Display & Graphics'].append(key)
-            elif any(prefix in key for prefix in ['MASTER_', 'SFX_', 'MUSIC_', 'AUDIO_', 'SOUND']):
-                self.categories['Audio Settings'].append(key)
-            elif any(prefix in key for prefix in ['MAP_', 'GROUND_', 'SKY_', 'SUN_', 'FOG_', 'WIND_']):
-                self.categories['Environment'].append(key)
-            elif any(prefix in key for prefix in ['PLAYER_', 'MOUSE_', 'CAMERA_', 'JUMP_', 'CROUCH_']):
-                self.categories['Player Settings'].append(key)
-            elif any(prefix in key for prefix in ['SLIDE_', 'DASH_', 'WALL_RUN_', 'ACCELERATION', 'FRICTION', 'MAX_SPEED']):
-                self.categories['Movement Mechanics'].append(key)
-            elif any(prefix in key for prefix in ['GUN_', 'RECOIL_', 'SHOOTING_', 'BULLET_', 'MUZZLE_']):
-                self.categories['Weapon Systems'].append(key)
-            elif any(prefix in key for prefix in ['TARGET_']):
-                self.categories['Target System'].append(key)
-            elif any(prefix in key for prefix in ['CASUAL_', 'TIMED_', 'TIMER_', 'SCORE_', 'POINTS_']):
-                self.categories['Game Modes'].append(key)
-            elif any(prefix in key for prefix in ['SHOW_', 'MENU_', 'CROSSHAIR_', 'HUD_']):
-                self.categories['User Interface'].append(key)
-            elif any(prefix in key for prefix in ['DEBUG_', 'QUALITY_', 'MAX_', 'ENABLE_']):
-                self.categories['Performance & Debug'].append(key)
+            for category, fragments in self.CATEGORY_RULES:
+                if key.startswith(fragments):
+                    break
             else:
-                # Default category for uncategorized settings
-                if 'Display & Graphics' not in [cat for cat, settings in self.categories.items() if key in settings]:
-                    self.categories['Display & Graphics'].append(key)
+                for category, search in self._CATEGORY_SEARCHES:
+                    if search(key):
+                        break
+                else:
+                    # Default category for uncategorized settings
+                    category = self.DEFAULT_CATEGORY
+            self.categories[category].append(key)
     
     def clear_screen(self):
         """Clear the terminal screen safely."""
+        if _VT_AVAILABLE and not _vt_checked:
+            _enable_vt()
+        if _VT_AVAILABLE:
+            try:
+                sys.stdout.write(_CLEAR_SEQ)
+                sys.stdout.flush()
+                return
+            except OSError:
+                pass
+        
         try:
             if os.name == 'nt':
                 subprocess.run(['cls'], shell=True, check=False, timeout=5)
@@ -254,142 +423,160 @@ class SettingsEditor:
 ║                     Interactive Configuration                ║
 ╚══════════════════════════════════════════════════════════════╝
         """
-        print(Colors.colorize(header, Colors.BRIGHT_CYAN))
+        parts = [Colors.fmt_bright_cyan(header), "\n"]
         
         if self.modified:
-            print(Colors.colorize("⚠️  Unsaved changes detected!", Colors.YELLOW))
-        print()
+            parts.append(Colors.fmt_yellow("⚠️  Unsaved changes detected!") + "\n")
+        parts.append("\n")
+        
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
     
     def print_main_menu(self):
         """Print the main category selection menu."""
-        print(Colors.colorize("📂 Configuration Categories:", Colors.BRIGHT_WHITE))
-        print()
+        parts = [Colors.fmt_bright_white("📂 Configuration Categories:"), "\n\n"]
+        add = parts.append
         
+        # Formatters as locals for the loop
+        fmt_blue, fmt_green, fmt_dim = Colors.fmt_bright_blue, Colors.fmt_green, Colors.fmt_dim
         for i, (category, settings) in enumerate(self.categories.items(), 1):
             count = len(settings)
             if count > 0:
-                color = Colors.GREEN if count > 0 else Colors.DIM
-                print(f"  {Colors.colorize(f'{i:2d}.', Colors.BRIGHT_BLUE)} "
-                      f"{Colors.colorize(category, color)} "
-                      f"{Colors.colorize(f'({count} settings)', Colors.DIM)}")
-        
-        print()
-        print(Colors.colorize("🔧 Actions:", Colors.BRIGHT_WHITE))
-        print(f"  {Colors.colorize('s.', Colors.BRIGHT_BLUE)} Save changes to config.py")
-        print(f"  {Colors.colorize('r.', Colors.BRIGHT_BLUE)} Reload from config.py")
-        print(f"  {Colors.colorize('v.', Colors.BRIGHT_BLUE)} Validate current settings")
-        print(f"  {Colors.colorize('p.', Colors.BRIGHT_BLUE)} Apply preset configuration")
-        print(f"  {Colors.colorize('q.', Colors.BRIGHT_BLUE)} Quit editor")
-        print()
+                add(f"  {fmt_blue(f'{i:2d}.')} "
+                    f"{fmt_green(category)} "
+                    f"{fmt_dim(f'({count} settings)')}\n")
+        
+        add("\n")
+        add(Colors.fmt_bright_white("🔧 Actions:") + "\n")
+        add(f"  {Colors.fmt_bright_blue('s.')} Save changes to config.py\n")
+        add(f"  {Colors.fmt_bright_blue('r.')} Reload from config.py\n")
+        add(f"  {Colors.fmt_bright_blue('v.')} Validate current settings\n")
+        add(f"  {Colors.fmt_bright_blue('p.')} Apply preset configuration\n")
+        add(f"  {Colors.fmt_bright_blue('q.')} Quit editor\n")
+        add("\n")
+        
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
     
     def print_category_menu(self, category: str):
         """Print settings for a specific category."""
         settings_list = self.categories[category]
         
-        print(Colors.colorize(f"📋 {category} Settings:", Colors.BRIGHT_WHITE))
-        print()
+        parts = [Colors.fmt_bright_white(f"📋 {category} Settings:"), "\n\n"]
+        add = parts.append
         
         if not settings_list:
-            print(Colors.colorize("  No settings in this category.", Colors.DIM))
+            add(Colors.fmt_dim("  No settings in this category.") + "\n")
+            sys.stdout.write("".join(parts))
+            sys.stdout.flush()
             return
         
+        # Everything the row loop touches, bound to locals once
+        settings = self.settings
+        display_cache = self._display_cache
+        get_cached = display_cache.get
+        get_type_color = _TYPE_COLOR.get
+        row_fmt = _ROW_FMT
+        fmt_white = Colors.fmt_white
+        green, red, white = Colors.GREEN, Colors.RED, Colors.WHITE
         for i, setting in enumerate(settings_list, 1):
-            if setting in self.settings:
-                value = self.settings[setting]
-                value_str = str(value)
-                
+            if setting not in settings:
+                continue
+            value = settings[setting]
+            value_type = type(value)
+            
+            # Reuse the display form while the value is unchanged
+            cached = get_cached(setting)
+            if cached is None or type(cached[0]) is not value_type or cached[0] != value:
                 # Color code based on value type
-                if isinstance(value, bool):
-                    value_color = Colors.GREEN if value else Colors.RED
-                elif isinstance(value, (int, float)):
-                    value_color = Colors.CYAN
-                elif isinstance(value, str):
-                    value_color = Colors.YELLOW
+                if value_type is bool:
+                    value_color = green if value else red
                 else:
-                    value_color = Colors.WHITE
+                    value_color = get_type_color(value_type, white)
                 
                 # Truncate long values
+                value_str = str(value)
                 if len(value_str) > 40:
                     value_str = value_str[:37] + "..."
                 
-                print(f"  {Colors.colorize(f'{i:2d}.', Colors.BRIGHT_BLUE)} "
-                      f"{Colors.colorize(setting, Colors.WHITE):30s} = "
-                      f"{Colors.colorize(value_str, value_color)}")
+                cached = display_cache[setting] = (value, fmt_white(setting), value_color, value_str)
+            
+            _, name_str, value_color, value_str = cached
+            add(row_fmt(i, name_str, value_color, value_str))
         
-        print()
-        print(Colors.colorize("🔧 Actions:", Colors.BRIGHT_WHITE))
-        print(f"  {Colors.colorize('b.', Colors.BRIGHT_BLUE)} Back to main menu")
-        print(f"  {Colors.colorize('1-{len(settings_list)}.', Colors.BRIGHT_BLUE)} Edit setting")
-        print()
+        add("\n")
+        add(Colors.fmt_bright_white("🔧 Actions:") + "\n")
+        add(f"  {Colors.fmt_bright_blue('b.')} Back to main menu\n")
+        add(f"  {Colors.fmt_bright_blue('1-{len(settings_list)}.')} Edit setting\n")
+        add("\n")
+        
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
     
     def edit_setting(self, setting_name: str):
         """Edit a specific setting."""
         current_value = self.settings.get(setting_name, "")
         
-        print(Colors.colorize(f"✏️  Editing: {setting_name}", Colors.BRIGHT_WHITE))
-        print(f"Current value: {Colors.colorize(str(current_value), Colors.CYAN)}")
+        print(Colors.fmt_bright_white(f"✏️  Editing: {setting_name}"))
+        print(f"Current value: {Colors.fmt_cyan(str(current_value))}")
         print()
         
         # Provide hints based on setting type
-        if isinstance(current_value, bool):
-            print(Colors.colorize("💡 Hint: Enter 'true' or 'false'", Colors.DIM))
-        elif isinstance(current_value, (int, float)):
-            print(Colors.colorize("💡 Hint: Enter a number", Colors.DIM))
-        elif isinstance(current_value, str):
-            print(Colors.colorize("💡 Hint: Enter text (quotes optional)", Colors.DIM))
+        hint, parser = self._TYPE_DISPATCH.get(type(current_value), (None, _parse_text))
+        if hint:
+            print(Colors.fmt_dim(hint))
         
-        print(Colors.colorize("Press Enter to keep current value, or type new value:", Colors.DIM))
+        print(Colors.fmt_dim("Press Enter to keep current value, or type new value:"))
         
         try:
-            new_value = input(f"{Colors.colorize('New value:', Colors.BRIGHT_GREEN)} ").strip()
+            new_value = input(f"{Colors.fmt_bright_green('New value:')} ").strip()
             
             # Validate input length
             if len(new_value) > self.MAX_INPUT_LENGTH:
-                print(Colors.colorize(f"❌ Input too long (max {self.MAX_INPUT_LENGTH} characters)", Colors.RED))
+                print(Colors.fmt_red(f"❌ Input too long (max {self.MAX_INPUT_LENGTH} characters)"))
                 return
             
             if not new_value:
-                print(Colors.colorize("✅ Value unchanged.", Colors.GREEN))
+                print(Colors.fmt_green("✅ Value unchanged."))
                 return
             
             # Parse the new value based on current type
             try:
-                if isinstance(current_value, bool):
-                    if new_value.lower() in ['true', 't', '1', 'yes', 'y', 'on']:
-                        parsed_value = True
-                    elif new_value.lower() in ['false', 'f', '0', 'no', 'n', 'off']:
-                        parsed_value = False
-                    else:
-                        raise ValueError("Invalid boolean value")
-                elif isinstance(current_value, int):
-                    parsed_value = int(new_value)
-                elif isinstance(current_value, float):
-                    parsed_value = float(new_value)
-                else:
-                    # String value - sanitize
-                    parsed_value = new_value.strip("'\"")
+                parsed_value = parser(new_value)
                 
                 # Validate the new value
                 is_valid, error_msg = self.validate_setting(setting_name, parsed_value)
                 if is_valid:
                     self.settings[setting_name] = parsed_value
                     self.modified = True
-                    print(Colors.colorize(f"✅ {setting_name} updated to: {parsed_value}", Colors.GREEN))
+                    print(Colors.fmt_green(f"✅ {setting_name} updated to: {parsed_value}"))
                 else:
-                    print(Colors.colorize(f"❌ Invalid value: {error_msg}", Colors.RED))
+                    print(Colors.fmt_red(f"❌ Invalid value: {error_msg}"))
             
             except ValueError as e:
-                print(Colors.colorize(f"❌ Invalid input format: {e}", Colors.RED))
+                print(Colors.fmt_red(f"❌ Invalid input format: {e}"))
         
         except ValueError as e:
-            print(Colors.colorize(f"❌ Invalid input: {e}", Colors.RED))
+            print(Colors.fmt_red(f"❌ Invalid input: {e}"))
         except KeyboardInterrupt:
-            print(Colors.colorize("\n❌ Edit cancelled.", Colors.YELLOW))
+            print(Colors.fmt_yellow("\n❌ Edit cancelled."))
         
-        input(Colors.colorize("\nPress Enter to continue...", Colors.DIM))
+        input(Colors.fmt_dim("\nPress Enter to continue..."))
     
     def validate_setting(self, setting_name: str, value: Any) -> tuple[bool, str]:
         """Validate a setting value with detailed error messages."""
+        # The result only depends on (name, value), so a repeat of the last value
+        # is answered from the cache (type is compared too: True == 1 == 1.0)
+        cached = self._validation_cache.get(setting_name)
+        if cached is not None and type(cached[0]) is type(value) and cached[0] == value:
+            return cached[1], cached[2]
+        
+        is_valid, message = self._validate_setting_uncached(setting_name, value)
+        self._validation_cache[setting_name] = (value, is_valid, message)
+        return is_valid, message
+    
+    def _validate_setting_uncached(self, setting_name: str, value: Any) -> tuple[bool, str]:
+        """Apply the validation rules for one setting value."""
         if not self._is_valid_setting_value(value):
             return False, "Invalid value type or content"
         
@@ -402,7 +589,7 @@ class SettingsEditor:
             if not (30 <= value <= 180):
                 return False, "FOV must be between 30 and 180 degrees"
         
-        elif setting_name in ['MAX_SPEED', 'PLAYER_JUMP_HEIGHT'] and isinstance(value, (int, float)):
+        elif setting_name in _POSITIVE_SETTINGS and isinstance(value, (int, float)):
             if value <= 0:
                 return False, "Value must be positive"
         
@@ -418,52 +605,44 @@ class SettingsEditor:
     def save_settings(self):
         """Save current settings back to config.py with backup and atomic operations."""
         try:
-            config_path = Path(self.config_file)
+            config_path = self.config_path
             
             # Create backup
-            backup_path = config_path.with_suffix('.py.backup')
+            backup_path = self._backup_path
             if config_path.exists():
                 shutil.copy2(config_path, backup_path)
-                print(Colors.colorize(f"📁 Backup created: {backup_path.name}", Colors.CYAN))
+                print(Colors.fmt_cyan(f"📁 Backup created: {backup_path.name}"))
             
             # Read the original file to preserve structure and comments
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            content = config_path.read_text(encoding='utf-8')
             
-            # Update lines with new values
-            updated_lines = []
-            for line in lines:
-                # Check if this line contains a setting we've modified
-                match = re.match(r'^([A-Z_][A-Z0-9_]*)\s*=\s*(.+?)(\s*#.*)?$', line.strip())
-                if match:
-                    key = match.group(1)
-                    comment = match.group(3) or ''
-                    
-                    if key in self.settings:
-                        value = self.settings[key]
-                        # Format the value safely
-                        if isinstance(value, str) and not value.startswith(('color.', 'Vec3(', 'window.')):
-                            formatted_value = repr(value)  # Use repr for safe string formatting
-                        else:
-                            formatted_value = str(value)
-                        
-                        updated_lines.append(f"{key} = {formatted_value}{comment}\n")
-                    else:
-                        updated_lines.append(line)
+            # Rewrite setting lines in one scan; other lines are never visited
+            def replace_setting(match):
+                key = match.group(1)
+                if key not in self.settings:
+                    return match.group(0)
+                
+                value = self.settings[key]
+                # Format the value safely
+                if isinstance(value, str) and not value.startswith(_URSINA_PREFIXES):
+                    formatted_value = repr(value)  # Use repr for safe string formatting
                 else:
-                    updated_lines.append(line)
+                    formatted_value = str(value)
+                
+                return f"{key} = {formatted_value}{match.group(3) or ''}"
+            
+            updated_content = _SETTING_LINE_RE_MULTI.sub(replace_setting, content)
             
             # Atomic write operation
-            temp_path = config_path.with_suffix('.py.tmp')
+            temp_path = self._temp_path
             try:
-                with open(temp_path, 'w', encoding='utf-8') as f:
-                    f.writelines(updated_lines)
+                temp_path.write_text(updated_content, encoding='utf-8')
                 
                 # Atomic move
                 temp_path.replace(config_path)
                 
                 self.modified = False
-                print(Colors.colorize("✅ Settings saved successfully!", Colors.GREEN))
+                print(Colors.fmt_green("✅ Settings saved successfully!"))
                 
             except Exception as e:
                 # Cleanup temp file on error
@@ -472,78 +651,47 @@ class SettingsEditor:
                 raise e
             
         except PermissionError:
-            print(Colors.colorize("❌ Permission denied writing config file!", Colors.RED))
+            print(Colors.fmt_red("❌ Permission denied writing config file!"))
         except Exception as e:
-            print(Colors.colorize(f"❌ Error saving settings: {e}", Colors.RED))
+            print(Colors.fmt_red(f"❌ Error saving settings: {e}"))
         
-        input(Colors.colorize("Press Enter to continue...", Colors.DIM))
+        input(Colors.fmt_dim("Press Enter to continue..."))
     
     def apply_preset(self):
         """Apply a preset configuration."""
-        presets = {
-            '1': ('Realistic Shooting', {
-                'RECOIL_VERTICAL': 4.0,
-                'RECOIL_HORIZONTAL': 2.0,
-                'RECOIL_RECOVERY_SPEED': 4.0,
-                'MOUSE_SENSITIVITY': 30,
-                'SFX_VOLUME': 1.0
-            }),
-            '2': ('Arcade Mode', {
-                'MAX_SPEED': 12,
-                'SPRINT_MULTIPLIER': 2.5,
-                'DASH_FORCE': 80,
-                'RECOIL_VERTICAL': 1.0,
-                'FOV_DEFAULT': 100
-            }),
-            '3': ('Precision Challenge', {
-                'MAX_SPEED': 4,
-                'RECOIL_VERTICAL': 1.5,
-                'MOUSE_SENSITIVITY': 25,
-                'TARGET_SIZE': 0.3,
-                'TIMER_DURATION': 120
-            }),
-            '4': ('Beginner Friendly', {
-                'RECOIL_VERTICAL': 1.0,
-                'RECOIL_HORIZONTAL': 0.3,
-                'TARGET_SIZE': 0.8,
-                'TIMER_DURATION': 90,
-                'MAX_SPEED': 5
-            })
-        }
-        
-        print(Colors.colorize("🎮 Available Presets:", Colors.BRIGHT_WHITE))
+        print(Colors.fmt_bright_white("🎮 Available Presets:"))
         print()
         
-        for key, (name, _) in presets.items():
-            print(f"  {Colors.colorize(f'{key}.', Colors.BRIGHT_BLUE)} {Colors.colorize(name, Colors.GREEN)}")
+        for key, (name, _) in PRESETS.items():
+            print(f"  {Colors.fmt_bright_blue(f'{key}.')} {Colors.fmt_green(name)}")
         
-        print(f"  {Colors.colorize('b.', Colors.BRIGHT_BLUE)} Back to main menu")
+        print(f"  {Colors.fmt_bright_blue('b.')} Back to main menu")
         print()
         
-        choice = input(Colors.colorize("Select preset: ", Colors.BRIGHT_GREEN)).strip()
+        choice = input(Colors.fmt_bright_green("Select preset: ")).strip()
         
         if choice == 'b':
             return
         
-        if choice in presets:
-            name, settings = presets[choice]
-            print(Colors.colorize(f"\n📥 Applying {name} preset...", Colors.CYAN))
+        if choice in PRESETS:
+            name, settings = PRESETS[choice]
+            print(Colors.fmt_cyan(f"\n📥 Applying {name} preset..."))
             
             for setting, value in settings.items():
                 if setting in self.settings:
                     self.settings[setting] = value
-                    print(f"  {Colors.colorize(setting, Colors.WHITE)} = {Colors.colorize(str(value), Colors.CYAN)}")
+                    print(f"  {Colors.fmt_white(setting)} = {Colors.fmt_cyan(str(value))}")
             
             self.modified = True
-            print(Colors.colorize(f"\n✅ {name} preset applied!", Colors.GREEN))
+            print(Colors.fmt_green(f"\n✅ {name} preset applied!"))
         else:
-            print(Colors.colorize("❌ Invalid preset selection.", Colors.RED))
+            print(Colors.fmt_red("❌ Invalid preset selection."))
         
-        input(Colors.colorize("Press Enter to continue...", Colors.DIM))
+        input(Colors.fmt_dim("Press Enter to continue..."))
     
     def validate_all_settings(self):
         """Validate all current settings."""
-        print(Colors.colorize("🔍 Validating all settings...", Colors.CYAN))
+        print(Colors.fmt_cyan("🔍 Validating all settings..."))
         print()
         
         issues = []
@@ -563,21 +711,21 @@ class SettingsEditor:
         
         # Display results
         if issues:
-            print(Colors.colorize("❌ Issues Found:", Colors.RED))
+            print(Colors.fmt_red("❌ Issues Found:"))
             for issue in issues:
                 print(f"  • {issue}")
             print()
         
         if warnings:
-            print(Colors.colorize("⚠️  Warnings:", Colors.YELLOW))
+            print(Colors.fmt_yellow("⚠️  Warnings:"))
             for warning in warnings:
                 print(f"  • {warning}")
             print()
         
         if not issues and not warnings:
-            print(Colors.colorize("✅ All settings are valid!", Colors.GREEN))
+            print(Colors.fmt_green("✅ All settings are valid!"))
         
-        input(Colors.colorize("Press Enter to continue...", Colors.DIM))
+        input(Colors.fmt_dim("Press Enter to continue..."))
     
     def run(self):
         """Run the interactive settings editor."""
@@ -589,22 +737,22 @@ class SettingsEditor:
                 self.print_main_menu()
                 
                 try:
-                    choice = input(Colors.colorize("Select option: ", Colors.BRIGHT_GREEN)).strip().lower()
+                    choice = input(Colors.fmt_bright_green("Select option: ")).strip().lower()
                     
                     if choice == 'q':
                         if self.modified:
-                            save_choice = input(Colors.colorize("Save changes before quitting? (y/n): ", Colors.YELLOW)).strip().lower()
+                            save_choice = input(Colors.fmt_yellow("Save changes before quitting? (y/n): ")).strip().lower()
                             if save_choice == 'y':
                                 self.save_settings()
-                        print(Colors.colorize("👋 Goodbye!", Colors.BRIGHT_CYAN))
+                        print(Colors.fmt_bright_cyan("👋 Goodbye!"))
                         break
                     elif choice == 's':
                         self.save_settings()
                     elif choice == 'r':
                         self.load_settings()
                         self.modified = False
-                        print(Colors.colorize("✅ Settings reloaded from file.", Colors.GREEN))
-                        input(Colors.colorize("Press Enter to continue...", Colors.DIM))
+                        print(Colors.fmt_green("✅ Settings reloaded from file."))
+                        input(Colors.fmt_dim("Press Enter to continue..."))
                     elif choice == 'v':
                         self.validate_all_settings()
                     elif choice == 'p':
@@ -623,7 +771,7 @@ class SettingsEditor:
                 self.print_category_menu(self.current_category)
                 
                 try:
-                    choice = input(Colors.colorize("Select option: ", Colors.BRIGHT_GREEN)).strip().lower()
+                    choice = input(Colors.fmt_bright_green("Select option: ")).strip().lower()
                     
                     if choice == 'b':
                         self.current_category = None
@@ -642,7 +790,7 @@ if __name__ == "__main__":
         editor = SettingsEditor()
         editor.run()
     except KeyboardInterrupt:
-        print(Colors.colorize("\n\n👋 Editor closed by user.", Colors.BRIGHT_CYAN))
+        print(Colors.fmt_bright_cyan("\n\n👋 Editor closed by user."))
     except Exception as e:
-        print(Colors.colorize(f"\n❌ Error: {e}", Colors.RED))
+        print(Colors.fmt_red(f"\n❌ Error: {e}"))
         sys.exit(1)
\ No newline at end of file